@@ -15,7 +15,7 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 from backtest.context import BacktestContext
-from backtest.data_fetcher import fetch_all_klines
+from backtest.data_fetcher import fetch_all_klines, klines_to_columns
 from backtest.engine import BacktestEngine
 from backtest.risk import BacktestRiskManager
 from binance.client import BinanceHTTPClient, normalize_binance_base_url
@@ -160,6 +160,9 @@ async def main():
             print("❌ 데이터가 없습니다.")
             return
         
+        # 원본 문자열 행 리스트는 버리고 컬럼형 배열만 유지 (메모리 절감)
+        klines = klines_to_columns(klines)
+        
         print()
         
         # 리스크 관리자 생성
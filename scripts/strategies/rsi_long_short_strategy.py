@@ -49,6 +49,7 @@
 from __future__ import annotations
 
 import importlib
+import logging
 import math
 import sys
 from pathlib import Path
@@ -63,6 +64,8 @@ if str(_SRC) not in sys.path:
 from strategy.base import Strategy
 from strategy.context import StrategyContext
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # 기본 파라미터 (BTCUSDT 5m, 8개월 다기간 안정성 우선)
@@ -178,10 +181,14 @@ def _value_at_offset(values: Any, offset_from_end: int) -> float | None:
     return v
 
 
-def _register_talib_indicator(ctx: StrategyContext, name: str) -> None:
+def _register_talib_indicator(
+    ctx: StrategyContext, name: str, memo: dict[str, Any] | None = None,
+) -> None:
     """TA-Lib 인디케이터 등록 (slope_offset 커스텀 kwarg 지원).
 
     slope_offset=N 이면 가장 최근값이 아닌 N봉 전의 값을 반환 (기울기 계산용).
+    memo 를 여러 인디케이터에 공유하면, 컨텍스트가 같은 입력 객체를 돌려주는 동안
+    (백테스트: 같은 봉) float64 변환과 TA-Lib 계산 결과를 재사용한다.
     """
 
     try:
@@ -207,16 +214,34 @@ def _register_talib_indicator(ctx: StrategyContext, name: str) -> None:
         if not callable(inputs_fn):
             return float("nan")
         raw = inputs_fn()
-        prepared = {
-            key: (np.asarray(list(values), dtype="float64") if not hasattr(values, "dtype") else values)
-            for key, values in raw.items()
-        }
-        if "real" not in prepared and "close" in prepared:
-            prepared["real"] = prepared["close"]
+        if memo is not None and memo.get("raw") is raw:
+            prepared = memo["prepared"]
+            results = memo["results"]
+        else:
+            prepared = {
+                key: (np.asarray(list(values), dtype="float64") if not hasattr(values, "dtype") else values)
+                for key, values in raw.items()
+            }
+            if "real" not in prepared and "close" in prepared:
+                prepared["real"] = prepared["close"]
+            results = {}
+            if memo is not None:
+                memo.update(raw=raw, prepared=prepared, results=results)
         if price_source is not None and price_source.lower() in _OHLCV:
-            prepared["real"] = prepared.get(price_source.lower(), prepared.get("close"))
-        fn = abstract.Function(name.strip().upper())
-        result = fn(prepared, **kwargs)
+            price_source = price_source.lower()
+            prepared = {**prepared, "real": prepared.get(price_source, prepared.get("close"))}
+        # 해시/정렬 불가한 파라미터(리스트 등)가 섞이면 메모 없이 바로 계산한다.
+        try:
+            result_key: tuple[Any, ...] | None = (name, price_source, tuple(sorted(kwargs.items())))
+            hash(result_key)
+        except TypeError:
+            result_key = None
+        result = results.get(result_key) if result_key is not None else None
+        if result is None:
+            fn = abstract.Function(name.strip().upper())
+            result = fn(prepared, **kwargs)
+            if result_key is not None:
+                results[result_key] = result
         if isinstance(result, dict):
             target = result[output] if (output is not None and output in result) else list(result.values())[0]
         elif isinstance(result, (list, tuple)):
@@ -334,10 +359,11 @@ class RsiLongShortStrategy(Strategy):
         else:
             self._mode = None
 
-        _register_talib_indicator(ctx, "RSI")
-        _register_talib_indicator(ctx, "ATR")
-        _register_talib_indicator(ctx, "ADX")
-        _register_talib_indicator(ctx, "EMA")
+        indicator_memo: dict[str, Any] = {}
+        _register_talib_indicator(ctx, "RSI", indicator_memo)
+        _register_talib_indicator(ctx, "ATR", indicator_memo)
+        _register_talib_indicator(ctx, "ADX", indicator_memo)
+        _register_talib_indicator(ctx, "EMA", indicator_memo)
 
         # 상태 초기화
         self._bars_since_close = 10**9
@@ -375,18 +401,16 @@ class RsiLongShortStrategy(Strategy):
     # ------------------------------------------------------------------ bar
     def on_bar(self, ctx: StrategyContext, bar: dict[str, Any]) -> None:  # noqa: C901
         if not self._banner_emitted:
-            try:
-                print(
-                    "🚀 [버전확인] RsiLongShortStrategy v6.0 "
-                    "(RSI multi-trigger trend-pullback) 시작!",
-                    flush=True,
-                )
-            except Exception:  # noqa: BLE001
-                pass
+            logger.info(
+                "🚀 [버전확인] RsiLongShortStrategy v6.0 (RSI multi-trigger trend-pullback) 시작!"
+            )
             self._banner_emitted = True
 
+        # 포지션은 이 호출 안에서 close_position 직후 return 할 때만 바뀌므로 한 번만 읽는다.
+        position_size = ctx.position_size
+
         # 무포지션 정리 (이전 봉에서 청산되었을 수 있음)
-        if ctx.position_size == 0:
+        if position_size == 0:
             if self._side is not None:
                 self._reset_position_state()
                 self._bars_since_close = 0
@@ -396,7 +420,7 @@ class RsiLongShortStrategy(Strategy):
             return
 
         # 매 틱: BE 시프트 + TP/SL 체크 (보유 중)
-        if ctx.position_size != 0 and self._side is not None:
+        if position_size != 0 and self._side is not None:
             self._maybe_breakeven_shift(last_price)
             if self._side == "LONG":
                 if self._take_price > 0 and last_price >= self._take_price:
@@ -419,7 +443,7 @@ class RsiLongShortStrategy(Strategy):
             return
 
         # 카운터
-        if ctx.position_size != 0:
+        if position_size != 0:
             self._bars_in_position += 1
         else:
             self._bars_since_close += 1
@@ -467,7 +491,7 @@ class RsiLongShortStrategy(Strategy):
         current_bias = "LONG" if long_bias else ("SHORT" if short_bias else None)
 
         # 보유 중: 시간/RSI 조기 청산
-        if ctx.position_size != 0 and self._side is not None:
+        if position_size != 0 and self._side is not None:
             if self._bars_in_position >= self.max_hold_bars:
                 ctx.close_position(reason="v6: TIME_EXIT")
                 return
@@ -531,9 +555,9 @@ class RsiLongShortStrategy(Strategy):
                 if prev_rsi < level <= rsi:
                     self._open_long(ctx, close_price, atr, level)
                     return
-
         # 숏 멀티 트리거: 어느 하나라도 cross-down 이면 진입
-        if short_bias and self._short_armed:
+        # (long_bias/short_bias 는 close vs EMA 로 상호 배타)
+        elif short_bias and self._short_armed:
             for level in self.short_trigger_levels:
                 if prev_rsi > level >= rsi:
                     self._open_short(ctx, close_price, atr, level)
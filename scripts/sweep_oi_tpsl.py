@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+import functools
 import importlib.util
 import io
 import json
@@ -32,6 +33,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -40,6 +42,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from backtest.context import BacktestContext  # noqa: E402
+from backtest.data_fetcher import KlineColumns  # noqa: E402
 from backtest.engine import BacktestEngine  # noqa: E402
 from backtest.risk import BacktestRiskManager  # noqa: E402
 from common.risk import RiskConfig  # noqa: E402
@@ -55,19 +58,29 @@ def _to_ms(date_str: str, end_of_day: bool = False) -> int:
     return int(dt.timestamp() * 1000)
 
 
-def load_klines_window(start_ts: int, end_ts: int) -> list[list[Any]]:
-    """Parquet에서 [start_ts, end_ts] 구간의 15m 캔들을 Binance kline list 형식으로 반환."""
-    df = pd.read_parquet(KLINES_PARQUET)
+@functools.lru_cache(maxsize=1)
+def _load_klines_frame() -> pd.DataFrame:
+    """워커 프로세스당 한 번만 parquet 을 읽고 이후 run 에서 재사용."""
+    return pd.read_parquet(KLINES_PARQUET).sort_values("ts", ignore_index=True)
+
+
+def load_klines_window(start_ts: int, end_ts: int) -> KlineColumns:
+    """Parquet에서 [start_ts, end_ts] 구간의 15m 캔들을 컬럼형 KlineColumns 로 반환."""
+    df = _load_klines_frame()
     mask = (df["ts"] >= start_ts) & (df["ts"] <= end_ts)
-    df = df.loc[mask].sort_values("ts").reset_index(drop=True)
-    out: list[list[Any]] = []
-    for row in df.itertuples(index=False):
-        ot = int(row.ts)
-        ct = ot + INTERVAL_MS - 1
-        # Binance kline format: [open_time, o, h, l, c, vol, close_time, qav, ntrade, tbbav, tbqav, ignore]
-        out.append([ot, float(row.o), float(row.h), float(row.l), float(row.c),
-                    0.0, ct, 0.0, 0, 0.0, 0.0, ""])
-    return out
+    # 캐시된 frame 은 이미 ts 정렬 상태이므로 구간마다 다시 정렬하지 않음
+    df = df.loc[mask].reset_index(drop=True)
+    # 행 단위 루프 대신 컬럼 배열로 바로 구성 (거래량 컬럼은 parquet 에 없으므로 0)
+    open_time = df["ts"].to_numpy(dtype=np.int64)
+    return KlineColumns(
+        open_time=open_time,
+        close_time=open_time + (INTERVAL_MS - 1),
+        open=df["o"].to_numpy(dtype=np.float64),
+        high=df["h"].to_numpy(dtype=np.float64),
+        low=df["l"].to_numpy(dtype=np.float64),
+        close=df["c"].to_numpy(dtype=np.float64),
+        volume=np.zeros(len(df), dtype=np.float64),
+    )
 
 
 def load_strategy_class(strategy_file: Path):
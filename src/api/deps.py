@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hmac
 import logging
 import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import asyncio
 
@@ -48,6 +50,31 @@ class AuthenticatedUser:
     _extra: dict[str, str] = field(default_factory=dict, repr=False)
 
 
+@dataclass(frozen=True, slots=True)
+class _AuthConfig:
+    """Request-independent auth settings, resolved once per process."""
+
+    nextauth_secret: bytes
+    nextauth_enabled: bool
+    entra_enabled: bool
+    allow_admin_fallback: bool
+    admin_token: bytes
+
+
+@lru_cache(maxsize=1)
+def _auth_config() -> _AuthConfig:
+    settings = get_settings()
+    nextauth_secret = (settings.nextauth.secret or "").strip()
+    entra = settings.entra_auth
+    return _AuthConfig(
+        nextauth_secret=nextauth_secret.encode(),
+        nextauth_enabled=settings.nextauth.enabled or bool(nextauth_secret),
+        entra_enabled=entra.enabled or bool((entra.client_id or "").strip()),
+        allow_admin_fallback=entra.allow_admin_fallback,
+        admin_token=settings.admin_token.strip().encode(),
+    )
+
+
 def _normalize_email(email: str | None) -> str:
     return (email or "").strip().lower()
 
@@ -59,12 +86,12 @@ def is_admin_email(email: str | None) -> bool:
 
 
 def _extract_bearer_token(authorization: str | None) -> str:
-    value = (authorization or "").strip()
-    if not value:
+    if not authorization:
         return ""
-    if not value.lower().startswith("bearer "):
+    scheme, _, token = authorization.strip().partition(" ")
+    if scheme.lower() != "bearer":
         return ""
-    return value[7:].strip()
+    return token.strip()
 
 
 def _get_jwk_client() -> PyJWKClient:
@@ -235,13 +262,11 @@ async def _verify_nextauth_user(
     user_id_header: str | None,
 ) -> AuthenticatedUser:
     """Verify request from NextAuth web proxy via shared secret."""
-    settings = get_settings()
-    expected_secret = (settings.nextauth.secret or "").strip()
+    expected_secret = _auth_config().nextauth_secret
     if not expected_secret:
         raise HTTPException(status_code=500, detail="AUTH_SECRET is not configured")
 
-    import hmac
-    if not hmac.compare_digest(token, expected_secret):
+    if not hmac.compare_digest(token.encode(), expected_secret):
         raise HTTPException(status_code=401, detail="Invalid auth secret")
 
     email = (email_header or "").strip() or None
@@ -255,35 +280,33 @@ async def require_auth(
     x_user_email: str | None = Header(default=None),
     x_chat_user_id: str | None = Header(default=None),
 ) -> AuthenticatedUser:
-    settings = get_settings()
+    auth = _auth_config()
+    nextauth_enabled = auth.nextauth_enabled
+    entra_enabled = auth.entra_enabled
+    token = _extract_bearer_token(authorization) if nextauth_enabled or entra_enabled else ""
 
     # 1. Try NextAuth shared-secret auth (preferred)
-    nextauth_enabled = settings.nextauth.enabled or bool((settings.nextauth.secret or "").strip())
     if nextauth_enabled:
-        token = _extract_bearer_token(authorization)
         if token:
             user = await _verify_nextauth_user(token, x_user_email, x_chat_user_id)
             return await _ensure_user_profile(user)
 
     # 2. Try Entra ID JWT auth (legacy)
-    entra = settings.entra_auth
-    entra_enabled = entra.enabled or bool((entra.client_id or "").strip())
     if entra_enabled:
-        token = _extract_bearer_token(authorization)
         if token:
             user = await _verify_entra_user(token)
             return await _ensure_user_profile(user)
-        if not entra.allow_admin_fallback:
+        if not auth.allow_admin_fallback:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
     # 3. Fall back to admin token
-    expected = settings.admin_token.strip()
+    expected = auth.admin_token
     if not expected:
         detail = "ADMIN_TOKEN is not configured"
         if entra_enabled or nextauth_enabled:
             detail = "Auth token is missing and ADMIN fallback is not configured"
         raise HTTPException(status_code=500, detail=detail)
-    if (x_admin_token or "").strip() != expected:
+    if not hmac.compare_digest((x_admin_token or "").strip().encode(), expected):
         raise HTTPException(status_code=401, detail="Unauthorized")
     admin_user = AuthenticatedUser(user_id="admin", email=None, provider="admin")
     return await _ensure_user_profile(admin_user)
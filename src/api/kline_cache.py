@@ -65,6 +65,10 @@ async def _get_redis() -> Any | None:
     return _redis_client
 
 
+# open_time, open, high, low, close, volume, close_time
+_KLINE_CACHED_FIELDS = 7
+
+
 def _cache_key(symbol: str, interval: str, start_ts: int, end_ts: int) -> str:
     return f"kline:{symbol}:{interval}:{start_ts}:{end_ts}"
 
@@ -94,14 +98,19 @@ async def set_cached_klines(
     end_ts: int,
     klines: list[list[Any]],
 ) -> None:
-    """Store klines in Redis cache with TTL."""
+    """Store klines in Redis cache with TTL.
+
+    Only the first seven kline fields (open_time .. close_time) are kept; the
+    trailing quote-volume / trade-count fields are never read by the backtest
+    engine and would otherwise inflate every cached payload.
+    """
     r = await _get_redis()
     if r is None:
         return
     key = _cache_key(symbol, interval, start_ts, end_ts)
     ttl = get_settings().redis.kline_cache_ttl
     try:
-        packed = msgpack.packb(klines, use_bin_type=True)
+        packed = msgpack.packb([row[:_KLINE_CACHED_FIELDS] for row in klines], use_bin_type=True)
         await r.set(key, packed, ex=ttl)
     except Exception:
         logger.warning("Redis cache write error", exc_info=True)
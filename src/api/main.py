@@ -201,7 +201,11 @@ from api.schemas import (
     WalletOverviewResponse,
     WalletSnapshot,
 )
-from api.strategy_catalog import list_strategy_files, validate_strategy_path
+from api.strategy_catalog import (
+    invalidate_strategy_files_cache,
+    list_strategy_files,
+    validate_strategy_path,
+)
 from api.strategy_params import (
     StrategyParamsError,
     apply_strategy_params,
@@ -661,7 +665,7 @@ def _job_to_response(job: Any) -> JobResponse:
 def _job_summary_row_to_response(row: Any) -> JobSummary:
     """Build a ``JobSummary`` from a row produced by ``list_job_summaries``.
 
-    The repo layer already strips heavy keys (``chart``, ``trades``) from
+    The repo layer already strips heavy keys (``chart``, ``trades``, ``equity_curve``) from
     ``result_json`` via SQL projection, so we never load multi-MB JSONB blobs
     into the API process. ``row.result_summary`` is therefore safe to pass
     through directly.
@@ -1105,6 +1109,10 @@ def _strategy_dirs() -> list[Path]:
     return [(root / p).resolve() for p in parts]
 
 
+# capability 레지스트리는 정적이므로 응답을 한 번만 만들어 재사용한다.
+_capability_response: StrategyCapabilityResponse | None = None
+
+
 def _local_capability_payload() -> dict[str, list[str]]:
     unsupported = [
         str(getattr(rule, "name", "")).strip() for rule in LOCAL_UNSUPPORTED_CAPABILITY_RULES
@@ -1248,11 +1256,22 @@ async def _delete_strategy_for_user(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     try:
         target.unlink()
+        invalidate_strategy_files_cache()
         return True
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed to delete file: {exc}") from exc
 
 
+def _sse_data(payload: dict[str, Any]) -> bytes:
+    """Encode one SSE `data:` frame for the LLM streaming endpoints.
+
+    Compact separators and raw UTF-8 (instead of \\uXXXX escapes for Korean
+    text) keep each frame close to the size of its actual content. Returned as
+    bytes so StreamingResponse writes the frame without another encode step.
+    """
+    return f"data: {json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}\n\n".encode()
+
+
 def _strip_code_fences(content: str) -> str:
     text = content.strip()
     if "```" not in text:
@@ -1641,6 +1660,20 @@ def create_app() -> FastAPI:
         if _keepalive_task:
             _keepalive_task.cancel()
             _logger.info("DB keep-alive task stopped")
+        try:
+            from backtest.data_fetcher import close_market_data_clients
+
+            await close_market_data_clients()
+        except Exception:  # noqa: BLE001
+            pass
+        # LLM 모듈은 첫 LLM 요청 때 로드된다. 한 번도 쓰지 않았다면 닫을 클라이언트도 없으므로
+        # 종료 시점에 SDK 를 새로 import 하지 않는다.
+        _llm_mod = sys.modules.get("llm.azure_openai")
+        if _llm_mod is not None:
+            try:
+                await _llm_mod.close_clients()
+            except Exception:  # noqa: BLE001
+                pass
 
     async def _db_session() -> AsyncIterator[AsyncSession]:
         from sqlalchemy.exc import InterfaceError, OperationalError
@@ -3065,6 +3098,10 @@ def create_app() -> FastAPI:
         dependencies=[Depends(require_admin)],
     )
     async def strategy_capabilities() -> StrategyCapabilityResponse:
+        global _capability_response
+        if _capability_response is not None:
+            return _capability_response
+
         payload: dict[str, Any] | None = None
         try:
             client = LLMClient()
@@ -3084,13 +3121,14 @@ def create_app() -> FastAPI:
                     out.append(s)
             return out
 
-        return StrategyCapabilityResponse(
+        _capability_response = StrategyCapabilityResponse(
             supported_data_sources=_to_str_list(payload.get("supported_data_sources")),
             supported_indicator_scopes=_to_str_list(payload.get("supported_indicator_scopes")),
             supported_context_methods=_to_str_list(payload.get("supported_context_methods")),
             unsupported_categories=_to_str_list(payload.get("unsupported_categories")),
             summary_lines=_to_str_list(payload.get("summary_lines")),
         )
+        return _capability_response
 
     @app.get(
         "/api/strategies/quality/summary",
@@ -3376,7 +3414,7 @@ def create_app() -> FastAPI:
                 error_stage="invalid_input",
                 error_message="user_prompt must be non-empty",
             )
-            yield f"data: {json.dumps({'error': 'user_prompt must be non-empty'})}\n\n"
+            yield _sse_data({"error": "user_prompt must be non-empty"})
             return
         try:
             client = LLMClient()
@@ -3387,7 +3425,7 @@ def create_app() -> FastAPI:
                 error_stage="client_init",
                 error_message=str(exc),
             )
-            yield f"data: {json.dumps({'error': str(exc)})}\n\n"
+            yield _sse_data({"error": str(exc)})
             return
 
         openai_messages = (
@@ -3413,22 +3451,22 @@ def create_app() -> FastAPI:
                         error_stage="stream_generation",
                         error_message=str(event.get("error")),
                     )
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield _sse_data(event)
                     return
                 # Forward phase events from llm to frontend
                 if "phase" in event:
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield _sse_data(event)
                 # Forward intent routing events (e.g. question) to frontend
                 if "intent" in event:
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield _sse_data(event)
                     return
                 # Forward plan_preview events to frontend
                 if "plan_preview" in event:
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield _sse_data(event)
                     return
                 if "token" in event:
                     code_acc.append(event["token"])
-                    yield f"data: {json.dumps({'token': event['token']})}\n\n"
+                    yield _sse_data({"token": event["token"]})
                 if event.get("done"):
                     # Relay already did verify+repair; extract results
                     stream_repaired = event.get("repaired", False)
@@ -3443,7 +3481,7 @@ def create_app() -> FastAPI:
                             error_stage="planner_rejected",
                             error_message="Non-trading request",
                         )
-                        yield f"data: {json.dumps({'done': True, 'rejected': True, 'code': rejection_msg, 'repaired': False, 'repair_attempts': 0})}\n\n"
+                        yield _sse_data({"done": True, "rejected": True, "code": rejection_msg, "repaired": False, "repair_attempts": 0})
                         return
                     if event.get("code"):
                         code_acc = [event["code"]]
@@ -3456,7 +3494,7 @@ def create_app() -> FastAPI:
                 error_stage="stream_exception",
                 error_message=str(exc),
             )
-            yield f"data: {json.dumps({'error': str(exc)})}\n\n"
+            yield _sse_data({"error": str(exc)})
             return
         code = _strip_code_fences("".join(code_acc))
         if not code:
@@ -3467,7 +3505,7 @@ def create_app() -> FastAPI:
                 error_stage="empty_code",
                 error_message="Empty code from stream",
             )
-            yield f"data: {json.dumps({'error': 'Empty code from stream'})}\n\n"
+            yield _sse_data({"error": "Empty code from stream"})
             return
         await _log_once(
             generation_attempted=True,
@@ -3476,19 +3514,15 @@ def create_app() -> FastAPI:
             repaired=stream_repaired,
             repair_attempts=stream_repair_attempts,
         )
-        yield (
-            "data: "
-            + json.dumps(
-                {
-                    "done": True,
-                    "code": code,
-                    "summary": None,
-                    "backtest_ok": False,
-                    "repaired": stream_repaired,
-                    "repair_attempts": stream_repair_attempts,
-                }
-            )
-            + "\n\n"
+        yield _sse_data(
+            {
+                "done": True,
+                "code": code,
+                "summary": None,
+                "backtest_ok": False,
+                "repaired": stream_repaired,
+                "repair_attempts": stream_repair_attempts,
+            }
         )
 
     @app.post("/api/strategies/generate/stream")
@@ -3521,21 +3555,21 @@ def create_app() -> FastAPI:
     async def _strategy_chat_stream_events(body: StrategyChatRequest):
         code = (body.code or "").strip()
         if not body.messages:
-            yield f"data: {json.dumps({'error': 'messages must be non-empty'})}\n\n"
+            yield _sse_data({"error": "messages must be non-empty"})
             return
         try:
             client = LLMClient()
         except ValueError as exc:
-            yield f"data: {json.dumps({'error': str(exc)})}\n\n"
+            yield _sse_data({"error": str(exc)})
             return
         openai_messages = [{"role": m.role, "content": m.content} for m in body.messages]
         try:
             async for event in client.strategy_chat_stream(code, body.summary, openai_messages):
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_data(event)
                 if event.get("done") or event.get("error"):
                     return
         except Exception as exc:  # noqa: BLE001
-            yield f"data: {json.dumps({'error': str(exc)})}\n\n"
+            yield _sse_data({"error": str(exc)})
 
     @app.post("/api/strategies/chat/stream")
     async def strategy_chat_stream_endpoint(body: StrategyChatRequest):
@@ -3730,6 +3764,7 @@ def create_app() -> FastAPI:
             raise HTTPException(
                 status_code=500, detail=f"Failed to write strategy file: {exc}"
             ) from exc
+        invalidate_strategy_files_cache()
         return StrategySaveResponse(path=str(final_target.relative_to(repo_root)))
 
     @app.post(
@@ -4395,8 +4430,40 @@ def create_app() -> FastAPI:
 
         async def gen() -> AsyncIterator[bytes]:
             yield b"retry: 5000\n\n"
+            # Snapshots rarely change between 5s ticks; only re-serialize (and
+            # re-send) the full jobs+trades payload when it actually differs.
+            last_payload: dict[str, Any] | None = None
+            # Trade rows are append-only (only raw_json is ever patched, and it is
+            # not streamed), so each formatted row is built once per connection
+            # and reused on later ticks instead of re-formatting every trade.
+            trade_rows: dict[tuple[uuid.UUID, int], dict[str, Any]] = {}
+
+            def _trade_rows(
+                job_id: uuid.UUID,
+                trades: list[Any],
+                fresh_rows: dict[tuple[uuid.UUID, int], dict[str, Any]],
+            ) -> list[dict[str, Any]]:
+                rows: list[dict[str, Any]] = []
+                for t in trades:
+                    key = (job_id, t.trade_id)
+                    row = trade_rows.get(key)
+                    if row is None:
+                        row = {
+                            "trade_id": t.trade_id,
+                            "symbol": t.symbol,
+                            "realized_pnl": t.realized_pnl,
+                            "quantity": t.quantity,
+                            "price": t.price,
+                            "commission": t.commission,
+                            "ts": t.ts.isoformat(),
+                        }
+                    fresh_rows[key] = row
+                    rows.append(row)
+                return rows
+
             try:
                 while True:
+                    fresh_rows: dict[tuple[uuid.UUID, int], dict[str, Any]] = {}
                     async with session_maker() as session:
                         running_jobs = await list_jobs(
                             session,
@@ -4421,24 +4488,21 @@ def create_app() -> FastAPI:
                                     "started_at": j.started_at.isoformat()
                                     if j.started_at
                                     else None,
-                                    "trades": [
-                                        {
-                                            "trade_id": t.trade_id,
-                                            "symbol": t.symbol,
-                                            "realized_pnl": t.realized_pnl,
-                                            "quantity": t.quantity,
-                                            "price": t.price,
-                                            "commission": t.commission,
-                                            "ts": t.ts.isoformat(),
-                                        }
-                                        for t in trades_map.get(j.job_id, [])
-                                    ],
+                                    "trades": _trade_rows(
+                                        j.job_id, trades_map.get(j.job_id, []), fresh_rows
+                                    ),
                                 }
                                 for j in running_jobs
                             ],
                         }
-                    data = json.dumps(payload, ensure_ascii=False, default=str)
-                    yield f"data: {data}\n\n".encode()
+                    # Drop rows for trades that fell out of the window / stopped jobs.
+                    trade_rows = fresh_rows
+                    if payload == last_payload:
+                        yield b": keepalive\n\n"
+                    else:
+                        data = json.dumps(payload, ensure_ascii=False, default=str)
+                        yield f"data: {data}\n\n".encode()
+                        last_payload = payload
                     await asyncio.sleep(5)
             except asyncio.CancelledError:
                 return
@@ -4755,8 +4819,11 @@ def create_app() -> FastAPI:
     async def events_stream(
         job_id: uuid.UUID,
         after_event_id: int = Query(default=0, ge=0),
+        kind: EventKind | None = Query(default=None),
         _user: AuthenticatedUser = Depends(require_auth),
     ) -> StreamingResponse:
+        # ``kind`` lets single-purpose widgets (e.g. the progress gauge) poll
+        # only the events they render instead of the full job event log.
         async def gen() -> AsyncIterator[bytes]:
             last_id = after_event_id
             # SSE retry hint (ms)
@@ -4767,7 +4834,7 @@ def create_app() -> FastAPI:
                     # Each open EventSource would otherwise reserve a pooled connection indefinitely.
                     async with session_maker() as session:
                         rows = await list_events(
-                            session, job_id=job_id, after_event_id=last_id, limit=200
+                            session, job_id=job_id, after_event_id=last_id, limit=200, kind=kind
                         )
                     if rows:
                         for ev in rows:
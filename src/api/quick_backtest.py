@@ -20,6 +20,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from api.kline_cache import (
     get_cached_klines,
     get_daily_quota_count,
@@ -35,9 +37,10 @@ from api.schemas import (
     QuickBacktestTrade,
 )
 from backtest.context import BacktestContext
+from backtest.data_fetcher import fetch_all_klines, get_market_data_client, klines_to_columns
 from backtest.engine import BacktestEngine
 from backtest.risk import BacktestRiskManager
-from binance.client import BinanceHTTPClient, normalize_binance_base_url
+from binance.client import normalize_binance_base_url
 from common.risk import RiskConfig
 from runner.strategy_loader import build_strategy, load_strategy_class
 from settings import get_settings
@@ -148,25 +151,14 @@ async def _fetch_klines_cached(
 
     settings = get_settings()
     base_url = settings.binance.base_url_backtest or settings.binance.base_url
-    client = BinanceHTTPClient(
-        api_key="",
-        api_secret="",
-        base_url=base_url,
+    klines = await fetch_all_klines(
+        get_market_data_client(base_url, timeout=10.0),
+        symbol=symbol,
+        interval=interval,
+        start_ts=start_ts,
+        end_ts=end_ts,
     )
 
-    try:
-        from backtest.data_fetcher import fetch_all_klines
-
-        klines = await fetch_all_klines(
-            client,
-            symbol=symbol,
-            interval=interval,
-            start_ts=start_ts,
-            end_ts=end_ts,
-        )
-    finally:
-        await client.aclose()
-
     if klines:
         await set_cached_klines(symbol, interval, start_ts, end_ts, klines)
 
@@ -184,25 +176,16 @@ def _compute_metrics(
     total_return_pct = ((final_balance - initial_balance) / initial_balance * 100) if initial_balance else 0.0
     total_commission = float(engine_result.get("total_commission", 0.0))
 
-    # Win rate — use the realized-PnL filter so short exits (which are
-    # recorded as BUY trades) are not silently dropped. Long exits live on
-    # SELL trades, short exits on BUY trades; both carry a "pnl" key, while
-    # pure entries do not.
-    exit_trades = [t for t in trades if "pnl" in t]
-    winning = [t for t in exit_trades if float(t.get("pnl", 0)) > 0]
-    total_trades = len(exit_trades)
-    win_rate = (len(winning) / total_trades * 100) if total_trades > 0 else 0.0
-
-    # Avg win / avg loss
-    wins = [float(t.get("pnl", 0)) for t in exit_trades if float(t.get("pnl", 0)) > 0]
-    losses = [float(t.get("pnl", 0)) for t in exit_trades if float(t.get("pnl", 0)) < 0]
-    avg_win_pct = (sum(wins) / len(wins) / initial_balance * 100) if wins else 0.0
-    avg_loss_pct = (sum(losses) / len(losses) / initial_balance * 100) if losses else 0.0
-
-    # Max drawdown
+    # Single walk over the trade list: running balance / max drawdown for
+    # every fill, plus the realized legs for win-rate and Sharpe. Win rate
+    # uses the realized-PnL filter so short exits (which are recorded as BUY
+    # trades) are not silently dropped. Long exits live on SELL trades, short
+    # exits on BUY trades; both carry a "pnl" key, while pure entries do not.
     equity_peak = initial_balance
     max_dd = 0.0
     running_balance = initial_balance
+    exit_pnl_list: list[float] = []
+    returns: list[float] = []
     for t in trades:
         pnl = float(t.get("pnl", 0))
         commission = float(t.get("commission", 0))
@@ -212,19 +195,30 @@ def _compute_metrics(
         dd = (equity_peak - running_balance) / equity_peak if equity_peak > 0 else 0.0
         if dd > max_dd:
             max_dd = dd
+        if "pnl" in t:
+            exit_pnl_list.append(pnl)
+            returns.append((pnl - commission) / initial_balance)
+    total_trades = len(exit_pnl_list)
+
+    # Avg win / avg loss — partition once with boolean masks instead of
+    # re-scanning the exit list per bucket.
+    exit_pnls = np.asarray(exit_pnl_list, dtype=np.float64)
+    wins = exit_pnls[exit_pnls > 0]
+    losses = exit_pnls[exit_pnls < 0]
+    win_rate = (wins.size / total_trades * 100) if total_trades > 0 else 0.0
+    avg_win_pct = (float(wins.mean()) / initial_balance * 100) if wins.size else 0.0
+    avg_loss_pct = (float(losses.mean()) / initial_balance * 100) if losses.size else 0.0
 
     # Sharpe ratio (simplified: daily returns approximation)
     sharpe = 0.0
     if total_trades >= 2:
-        returns = [(float(t.get("pnl", 0)) - float(t.get("commission", 0))) / initial_balance for t in exit_trades]
-        if returns:
-            import statistics
+        import statistics
 
-            mean_r = statistics.mean(returns)
-            std_r = statistics.stdev(returns) if len(returns) > 1 else 0.0
-            sharpe = (mean_r / std_r * (252 ** 0.5)) if std_r > 0 else 0.0
-            if not math.isfinite(sharpe):
-                sharpe = 0.0
+        mean_r = statistics.mean(returns)
+        std_r = statistics.stdev(returns)
+        sharpe = (mean_r / std_r * (252 ** 0.5)) if std_r > 0 else 0.0
+        if not math.isfinite(sharpe):
+            sharpe = 0.0
 
     return QuickBacktestMetrics(
         initial_balance=initial_balance,
@@ -270,23 +264,12 @@ def _build_trades_summary(engine_result: dict[str, Any]) -> list[QuickBacktestTr
     return summary
 
 
-def _build_equity_curve(engine_result: dict[str, Any], initial_balance: float) -> list[QuickBacktestEquityPoint]:
-    """Build lightweight equity curve from trade sequence."""
-    trades = engine_result.get("trades", [])
-    curve: list[QuickBacktestEquityPoint] = []
-    balance = initial_balance
-
-    for t in trades:
-        pnl = float(t.get("pnl", 0))
-        commission = float(t.get("commission", 0))
-        ts = int(t.get("timestamp", 0))
-        balance += pnl - commission
-        # Plot one point per closed leg (exits carry the "pnl" key for both
-        # long-exit SELL and short-exit BUY trades).
-        if "pnl" in t and ts > 0:
-            curve.append(QuickBacktestEquityPoint(ts=ts, balance=round(balance, 2)))
-
-    return curve
+def _build_equity_curve(engine_result: dict[str, Any]) -> list[QuickBacktestEquityPoint]:
+    """Build lightweight equity curve from the engine's per-exit balances."""
+    return [
+        QuickBacktestEquityPoint(ts=int(p["ts"]), balance=round(float(p["balance"]), 2))
+        for p in engine_result.get("equity_curve", [])
+    ]
 
 
 async def run_quick_backtest(
@@ -364,7 +347,7 @@ async def run_quick_backtest(
     engine_result = result["engine_result"]
     metrics = _compute_metrics(engine_result, req.initial_balance)
     trades_summary = _build_trades_summary(engine_result)
-    equity_curve = _build_equity_curve(engine_result, req.initial_balance)
+    equity_curve = _build_equity_curve(engine_result)
 
     return QuickBacktestResponse(
         success=True,
@@ -427,6 +410,10 @@ async def _execute_backtest(req: QuickBacktestRequest) -> dict[str, Any]:
             "message": f"{symbol} {req.interval}에 대한 데이터가 없습니다. 심볼과 인터벌을 확인해주세요.",
         }
 
+    # Keep only the columnar float64/int64 form during the run; rebinding drops
+    # the raw string-row list so both representations are not held at once.
+    klines = klines_to_columns(klines)
+
     # Write strategy to temp file and execute
     tmp_dir = Path(tempfile.mkdtemp(prefix="quick_bt_"))
     tmp_file = tmp_dir / f"strategy_{uuid.uuid4().hex[:8]}.py"
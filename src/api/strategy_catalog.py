@@ -2,8 +2,42 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# The strategy list is requested on every page load. Creating, deleting or
+# renaming a file bumps its directory's mtime, so the scan result is cached
+# against the directories' mtimes: a request costs one stat() per directory
+# and only rescans after something changed, including writes made outside
+# the API (agent tools, deploys). Writers in this process still call
+# invalidate_strategy_files_cache() to cover coarse mtime granularity.
+_DirsFingerprint = tuple[float | None, ...]
+_strategy_files_cache: dict[tuple[Path, ...], tuple[_DirsFingerprint, list[Path]]] = {}
+
+
+def invalidate_strategy_files_cache() -> None:
+    _strategy_files_cache.clear()
+
+
+def _dirs_fingerprint(strategy_dirs: tuple[Path, ...]) -> _DirsFingerprint:
+    mtimes: list[float | None] = []
+    for d in strategy_dirs:
+        try:
+            mtimes.append(d.stat().st_mtime)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
 
 def list_strategy_files(strategy_dirs: list[Path]) -> list[Path]:
+    key = tuple(strategy_dirs)
+    fingerprint = _dirs_fingerprint(key)
+    cached = _strategy_files_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return list(cached[1])
+    files_sorted = _scan_strategy_files(strategy_dirs)
+    _strategy_files_cache[key] = (fingerprint, files_sorted)
+    return list(files_sorted)
+
+
+def _scan_strategy_files(strategy_dirs: list[Path]) -> list[Path]:
     files: list[Path] = []
     for d in strategy_dirs:
         if not d.exists():
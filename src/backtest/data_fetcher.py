@@ -1,10 +1,126 @@
 """백테스트용 과거 데이터 수집."""
 
 import asyncio
-from typing import Any, Callable
+import itertools
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
 
 from binance.client import BinanceHTTPClient
 
+# 바이낸스 kline 행에서 사용하는 필드 (이름, 행 인덱스, dtype)
+_KLINE_FIELDS: tuple[tuple[str, int, type], ...] = (
+    ("open_time", 0, np.int64),
+    ("close_time", 6, np.int64),
+    ("open", 1, np.float64),
+    ("high", 2, np.float64),
+    ("low", 3, np.float64),
+    ("close", 4, np.float64),
+    ("volume", 5, np.float64),
+)
+
+# 캔들 간격별 길이(밀리초). 월봉(1M)처럼 길이가 고정되지 않은 간격은 순차 수집으로 처리.
+_INTERVAL_MS: dict[str, int] = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "2h": 2 * 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "6h": 6 * 60 * 60_000,
+    "8h": 8 * 60 * 60_000,
+    "12h": 12 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+    "3d": 3 * 24 * 60 * 60_000,
+    "1w": 7 * 24 * 60 * 60_000,
+}
+
+# 동시에 보낼 최대 kline 요청 수 (바이낸스 IP 레이트 리밋 고려)
+_MAX_CONCURRENT_REQUESTS = 5
+# 동시 수집 시 쓰는 분당 요청 가중치 예산. IP 한도(2400/분) 전부를 쓰지 않고
+# 같은 IP 의 라이브 주문/시세 조회 몫을 남긴다. 요청 시작 간격을 가중치에 맞춰 벌려
+# 동시 요청이 한꺼번에 몰리지 않게 한다 (429 는 fetch_klines 가 Retry-After 로 재시도).
+_KLINES_WEIGHT_BUDGET_PER_MINUTE = 1800
+
+
+def _klines_request_weight(limit: int) -> int:
+    """/fapi/v1/klines 요청 가중치 (limit 구간별, 바이낸스 문서 기준)."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+# 공개 시세 조회용 클라이언트 풀. 백테스트마다 새 클라이언트를 만들면 매번
+# TCP/TLS 핸드셰이크가 발생하므로 (base_url, timeout) 별로 하나씩 재사용한다.
+# httpx 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+_market_data_clients: dict[tuple[str, float], BinanceHTTPClient] = {}
+_market_data_clients_loop: asyncio.AbstractEventLoop | None = None
+# 루프 교체로 버려진 클라이언트의 닫기 태스크 (완료 전 GC 방지용 참조)
+_retired_client_closes: set[asyncio.Task[None]] = set()
+
+
+async def _aclose_quietly(client: BinanceHTTPClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _retire_market_data_clients(old_loop: asyncio.AbstractEventLoop | None) -> None:
+    """이전 루프에 묶인 클라이언트를 캐시에서 빼고 커넥션 풀을 닫습니다.
+
+    이전 루프가 다른 스레드에서 아직 돌고 있으면 그 루프에서 닫고, 이미 멈췄거나
+    닫혔으면 현재 루프에서 닫기를 시도합니다 (소켓 정리는 best-effort).
+    """
+    clients = list(_market_data_clients.values())
+    _market_data_clients.clear()
+    if not clients:
+        return
+    if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+        for client in clients:
+            asyncio.run_coroutine_threadsafe(_aclose_quietly(client), old_loop)
+        return
+    loop = asyncio.get_running_loop()
+    for client in clients:
+        task = loop.create_task(_aclose_quietly(client))
+        _retired_client_closes.add(task)
+        task.add_done_callback(_retired_client_closes.discard)
+
+
+def get_market_data_client(base_url: str, *, timeout: float = 60.0) -> BinanceHTTPClient:
+    """kline 조회용(API 키 없음) BinanceHTTPClient 를 base_url 별로 공유합니다.
+
+    반환된 클라이언트는 호출자가 닫지 않습니다. 프로세스 종료 시
+    ``close_market_data_clients()`` 로 정리합니다.
+    """
+    global _market_data_clients_loop
+    loop = asyncio.get_running_loop()
+    if _market_data_clients_loop is not loop:
+        _retire_market_data_clients(_market_data_clients_loop)
+        _market_data_clients_loop = loop
+    key = (base_url, float(timeout))
+    client = _market_data_clients.get(key)
+    if client is None:
+        client = BinanceHTTPClient(api_key="", api_secret="", base_url=base_url, timeout=timeout)
+        _market_data_clients[key] = client
+    return client
+
+
+async def close_market_data_clients() -> None:
+    """공유 중인 kline 조회용 클라이언트를 모두 닫습니다."""
+    clients = list(_market_data_clients.values())
+    _market_data_clients.clear()
+    for client in clients:
+        await _aclose_quietly(client)
+    if _retired_client_closes:
+        await asyncio.gather(*_retired_client_closes, return_exceptions=True)
+
 
 async def fetch_all_klines(
     client: BinanceHTTPClient,
@@ -19,7 +135,8 @@ async def fetch_all_klines(
     
     바이낸스 API는 한 번에 최대 1500개만 가져올 수 있으므로,
     시작 시간부터 종료 시간까지 모든 데이터를 가져오기 위해
-    여러 번 호출합니다.
+    여러 번 호출합니다. 간격 길이가 고정된 경우 기간을 구간으로 나눠
+    동시에 요청하고(최대 동시 요청 수 제한), 그 외에는 순차적으로 수집합니다.
     
     Args:
         client: 바이낸스 클라이언트
@@ -33,6 +150,110 @@ async def fetch_all_klines(
     Returns:
         전체 기간의 캔들 데이터 리스트
     """
+    interval_ms = _INTERVAL_MS.get(interval)
+    if interval_ms is not None and end_ts - start_ts >= batch_size * interval_ms:
+        return await _fetch_klines_concurrent(
+            client,
+            symbol,
+            interval,
+            start_ts,
+            end_ts,
+            window_ms=batch_size * interval_ms,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
+        )
+    return await _fetch_klines_sequential(
+        client,
+        symbol,
+        interval,
+        start_ts,
+        end_ts,
+        batch_size=batch_size,
+        progress_callback=progress_callback,
+    )
+
+
+async def _fetch_klines_concurrent(
+    client: BinanceHTTPClient,
+    symbol: str,
+    interval: str,
+    start_ts: int,
+    end_ts: int,
+    *,
+    window_ms: int,
+    batch_size: int,
+    progress_callback: Callable[[float], None] | None,
+) -> list[list[Any]]:
+    """기간을 batch_size개 캔들 단위 구간으로 나눠 동시에 수집합니다.
+
+    각 구간은 최대 batch_size개 캔들만 포함하므로 구간당 한 번의 호출로 충분합니다.
+    """
+    windows = [
+        (window_start, min(window_start + window_ms - 1, end_ts))
+        for window_start in range(start_ts, end_ts + 1, window_ms)
+    ]
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    pace_lock = asyncio.Lock()
+    request_spacing = _klines_request_weight(batch_size) * 60.0 / _KLINES_WEIGHT_BUDGET_PER_MINUTE
+    clock = asyncio.get_running_loop().time
+    next_request_at = clock()
+    completed = 0
+
+    print(f"📥 과거 데이터 수집 시작: {symbol} {interval} ({len(windows)}개 구간 동시 수집)")
+    print(f"   기간: {start_ts} ~ {end_ts}")
+
+    async def _fetch_window(window_start: int, window_end: int) -> list[list[Any]]:
+        nonlocal completed, next_request_at
+        async with semaphore:
+            # 요청 시작 시각을 가중치 예산에 맞춰 순서대로 배정
+            async with pace_lock:
+                delay = next_request_at - clock()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_request_at = max(clock(), next_request_at) + request_spacing
+            klines = await client.fetch_klines(
+                symbol=symbol,
+                interval=interval,
+                start_ts=window_start,
+                end_ts=window_end,
+                limit=batch_size,
+            )
+        completed += 1
+        if progress_callback:
+            progress_callback(min(100.0, completed / len(windows) * 100))
+        return klines or []
+
+    results = await asyncio.gather(*(_fetch_window(s, e) for s, e in windows))
+
+    # gather 는 구간 순서를, 바이낸스는 구간 내 시간 순서를 보장하므로 재정렬 없이
+    # 이어 붙이고 구간 경계에서 겹칠 수 있는 캔들만 open_time 기준으로 제거
+    all_klines: list[list[Any]] = []
+    last_ts: int | None = None
+    for kline in itertools.chain.from_iterable(results):
+        open_time = int(kline[0])
+        if last_ts is not None and open_time <= last_ts:
+            continue
+        all_klines.append(kline)
+        last_ts = open_time
+
+    if progress_callback:
+        progress_callback(100.0)
+
+    print(f"✅ 데이터 수집 완료: 총 {len(all_klines)}개 캔들")
+    return all_klines
+
+
+async def _fetch_klines_sequential(
+    client: BinanceHTTPClient,
+    symbol: str,
+    interval: str,
+    start_ts: int,
+    end_ts: int,
+    *,
+    batch_size: int,
+    progress_callback: Callable[[float], None] | None,
+) -> list[list[Any]]:
+    """마지막 캔들의 종료 시간을 따라가며 순차적으로 페이지를 수집합니다."""
     all_klines: list[list[Any]] = []
     current_start_ts = start_ts
     max_iterations = 10000  # 무한 루프 방지
@@ -101,3 +322,39 @@ async def fetch_all_klines(
     print(f"✅ 데이터 수집 완료: 총 {len(all_klines)}개 캔들")
     return all_klines
 
+
+class KlineColumns(NamedTuple):
+    """컬럼 단위(SoA) kline 저장소. 각 필드는 캔들 수 길이의 1D ndarray 입니다."""
+
+    open_time: np.ndarray
+    close_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """캔들 개수."""
+        return int(self.open_time.shape[0])
+
+
+def klines_to_columns(klines: "list[list[Any]] | KlineColumns") -> KlineColumns:
+    """kline 리스트를 int64 시간 / float64 OHLCV 컬럼으로 한 번에 변환합니다.
+
+    행마다 ``int()``/``float()`` 를 호출하는 대신 2D 배열로 한 번에 캐스팅합니다.
+    바이낸스는 가격/거래량을 문자열로 내려주므로 object 배열을 거쳐 변환합니다.
+    이미 변환된 ``KlineColumns`` 는 그대로 반환합니다.
+    """
+    if isinstance(klines, KlineColumns):
+        return klines
+    if not klines:
+        return KlineColumns(*(np.empty(0, dtype=dtype) for _, _, dtype in _KLINE_FIELDS))
+    arr = np.asarray([row[:7] for row in klines], dtype=object)
+    return KlineColumns(*(arr[:, idx].astype(dtype) for _, idx, dtype in _KLINE_FIELDS))
+
+
+def klines_to_frame(klines: "list[list[Any]] | KlineColumns") -> pd.DataFrame:
+    """kline 을 컬럼형 DataFrame(int64 시간 / float64 OHLCV)으로 변환합니다."""
+    return pd.DataFrame(klines_to_columns(klines)._asdict())
@@ -3,6 +3,7 @@
 from typing import Any, Callable
 
 from backtest.context import BacktestContext
+from backtest.data_fetcher import KlineColumns, klines_to_columns
 from strategy.base import Strategy
 
 
@@ -13,7 +14,7 @@ class BacktestEngine:
         self,
         strategy: Strategy,
         context: BacktestContext,
-        klines: list[list[Any]],
+        klines: list[list[Any]] | KlineColumns,
         progress_callback: Callable[[float], None] | None = None,
     ) -> None:
         self.strategy = strategy
@@ -24,7 +25,10 @@ class BacktestEngine:
     
     def run(self) -> dict[str, Any]:
         """백테스트 실행."""
-        print(f"🚀 백테스트 시작: {len(self.klines)}개 캔들")
+        # 행마다 int()/float() 를 호출하지 않도록 전체 kline 을 한 번에 컬럼 단위로 변환
+        columns = klines_to_columns(self.klines)
+        total_klines = columns.size
+        print(f"🚀 백테스트 시작: {total_klines}개 캔들")
         
         initial_balance = self.ctx.balance
         
@@ -32,18 +36,19 @@ class BacktestEngine:
         self.strategy.initialize(self.ctx)
         
         prev_bar_timestamp: int | None = None
-        total_klines = len(self.klines)
         progress_interval = max(1, total_klines // 200)  # ~0.5% steps
         
-        for i, kline in enumerate(self.klines):
-            open_time = int(kline[0])
-            close_time = int(kline[6])
-            open_price = float(kline[1])
-            high_price = float(kline[2])
-            low_price = float(kline[3])
-            close_price = float(kline[4])
-            volume = float(kline[5])
-            
+        bars = zip(
+            columns.open_time.tolist(),
+            columns.close_time.tolist(),
+            columns.open.tolist(),
+            columns.high.tolist(),
+            columns.low.tolist(),
+            columns.close.tolist(),
+            columns.volume.tolist(),
+        )
+        
+        for i, (open_time, close_time, open_price, high_price, low_price, close_price, volume) in enumerate(bars):
             is_new_bar = prev_bar_timestamp != open_time
             
             position_size_before = self.ctx.position_size
@@ -203,6 +208,13 @@ class BacktestEngine:
         wins = sum(1 for t in exit_trades if float(t.get("pnl", 0.0)) > 0)
         win_rate = (wins / num_trades * 100) if num_trades > 0 else 0.0
         
+        # 청산 체결마다 기록된 balance_after 로 자산 곡선 구성 (거래 재생 불필요)
+        equity_curve = [
+            {"ts": int(t["timestamp"]), "balance": float(t["balance_after"])}
+            for t in exit_trades
+            if t.get("timestamp") and "balance_after" in t
+        ]
+        
         self.results = {
             "initial_balance": initial_balance,
             "final_balance": final_equity,
@@ -214,6 +226,7 @@ class BacktestEngine:
             "win_rate": win_rate,
             "max_drawdown_pct": self.ctx.max_drawdown_pct,
             "trades": self.ctx.trades,
+            "equity_curve": equity_curve,
         }
         
         print(f"✅ 백테스트 완료")
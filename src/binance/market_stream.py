@@ -20,6 +20,9 @@ from typing import Any, Awaitable, Callable
 
 import aiohttp
 
+# 봉 마감 직후 REST 응답에 확정 봉이 반영되기까지의 여유(초).
+_BAR_CLOSE_GRACE_SEC = 0.5
+
 
 class BinanceMarketStream:
     """Kline 데이터 공급자 (REST 폴링 기반).
@@ -67,6 +70,9 @@ class BinanceMarketStream:
             self._poll_interval_sec = 10.0
         # 이미 콜백으로 송출한 마지막 "확정 봉" 의 open_time(ms).
         self._last_emitted_close_open_time: int | None = None
+        # 마지막 응답에서 본 진행 중 봉의 close_time(ms). 다음 폴링을 봉 마감
+        # 직후로 당겨 확정 봉 감지 지연(최대 폴링 주기)을 없애는 데 사용한다.
+        self._in_progress_close_time: int | None = None
 
     async def start(self) -> None:
         """REST 폴링 루프 시작 (자동 재시도 포함)."""
@@ -127,10 +133,7 @@ class BinanceMarketStream:
                         flush=True,
                     )
 
-                # 연속 실패 시 백오프, 그 외엔 정상 폴링 주기.
-                sleep_sec = self._poll_interval_sec
-                if consecutive_errors > 0:
-                    sleep_sec = min(60.0, self._poll_interval_sec * (1 + consecutive_errors))
+                sleep_sec = self._next_poll_delay(consecutive_errors, int(time.time() * 1000))
                 try:
                     await asyncio.sleep(sleep_sec)
                 except asyncio.CancelledError:
@@ -142,6 +145,22 @@ class BinanceMarketStream:
                 await self._session.close()
                 self._session = None
 
+    def _next_poll_delay(self, consecutive_errors: int, now_ms: int) -> float:
+        """다음 폴링까지 대기 시간(초).
+
+        연속 실패 시 백오프, 그 외엔 정상 폴링 주기를 쓰되 진행 중 봉의 마감이
+        그보다 먼저 오면 마감 직후(+_BAR_CLOSE_GRACE_SEC)로 당긴다. 고정 주기만
+        쓰면 확정 봉이 최대 폴링 주기만큼 늦게 전략에 전달된다.
+        """
+        if consecutive_errors > 0:
+            return min(60.0, self._poll_interval_sec * (1 + consecutive_errors))
+        sleep_sec = self._poll_interval_sec
+        close_t = self._in_progress_close_time
+        if close_t is not None:
+            until_close = max(0.0, (close_t + 1 - now_ms) / 1000.0)
+            sleep_sec = min(sleep_sec, until_close + _BAR_CLOSE_GRACE_SEC)
+        return sleep_sec
+
     async def _emit_klines(self, klines: Any) -> None:
         """REST 응답을 합성된 kline 이벤트로 변환해 콜백 송출."""
         if not isinstance(klines, list) or not klines:
@@ -180,6 +199,11 @@ class BinanceMarketStream:
                             flush=True,
                         )
 
+        try:
+            self._in_progress_close_time = int(in_progress[6])
+        except (TypeError, ValueError, IndexError):
+            self._in_progress_close_time = None
+
         # 2) 진행 중인 봉은 매 폴링마다 x=False 로 송출 → mark_price 갱신.
         payload = self._build_kline_payload(in_progress, now_ms, is_closed=False)
         if payload is not None:
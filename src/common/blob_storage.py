@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from typing import Any
 
 from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
@@ -10,6 +11,27 @@ from azure.storage.blob import ContainerClient
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def default_blob_credential() -> Any:
+    """Blob Storage 용 프로세스 공용 자격증명.
+
+    Container Apps / Azure 환경(IDENTITY_ENDPOINT)에서는 ManagedIdentityCredential,
+    그 외에는 DefaultAzureCredential 을 사용한다. 자격증명 인스턴스가 토큰 캐시를
+    들고 있으므로 호출마다 새로 만들지 않고 재사용해 AAD 토큰 왕복을 피한다.
+    """
+    client_id = os.getenv("AZURE_CLIENT_ID", "").strip()
+    if os.getenv("IDENTITY_ENDPOINT"):
+        kwargs: dict[str, Any] = {}
+        if client_id:
+            kwargs["client_id"] = client_id
+        logger.info("Using ManagedIdentityCredential for Azure Blob Storage")
+        return ManagedIdentityCredential(**kwargs)
+    kwargs = {}
+    if client_id:
+        kwargs["managed_identity_client_id"] = client_id
+    return DefaultAzureCredential(**kwargs)
+
+
 class StrategyBlobService:
     """사용자별 전략 코드를 Azure Blob Storage에 저장/조회한다."""
 
@@ -22,19 +44,7 @@ class StrategyBlobService:
 
     @classmethod
     def from_account_url(cls, account_url: str, container_name: str = "strategies") -> StrategyBlobService:
-        client_id = os.getenv("AZURE_CLIENT_ID", "").strip()
-        # Container Apps / Azure 환경에서는 ManagedIdentityCredential 우선 사용
-        if os.getenv("IDENTITY_ENDPOINT"):
-            kwargs: dict[str, Any] = {}
-            if client_id:
-                kwargs["client_id"] = client_id
-            credential = ManagedIdentityCredential(**kwargs)
-            logger.info("Using ManagedIdentityCredential for Azure Blob Storage")
-        else:
-            kwargs = {}
-            if client_id:
-                kwargs["managed_identity_client_id"] = client_id
-            credential = DefaultAzureCredential(**kwargs)
+        credential = default_blob_credential()
         return cls(ContainerClient(account_url=account_url, container_name=container_name, credential=credential))
 
     def _blob_path(self, user_id: str, strategy_name: str) -> str:
@@ -377,7 +377,7 @@ async def list_jobs(
 
 # Heavy keys stripped from result_json at SQL projection time for list endpoints.
 # Keep in sync with src/api/main.py JobSummary serializer expectations.
-_HEAVY_RESULT_KEYS: tuple[str, ...] = ("chart", "trades")
+_HEAVY_RESULT_KEYS: tuple[str, ...] = ("chart", "trades", "equity_curve")
 
 
 async def list_job_summaries(
@@ -390,7 +390,7 @@ async def list_job_summaries(
 ) -> list[Row[Any]]:
     """List jobs with a slimmed-down ``result_summary`` projection.
 
-    Strips heavy keys (``chart``, ``trades``) from ``result_json`` at the SQL
+    Strips heavy keys (``chart``, ``trades``, ``equity_curve``) from ``result_json`` at the SQL
     layer so the API process never materializes multi-MB JSONB blobs in memory.
     Use this for list/summary endpoints; for full result payloads keep using
     :func:`get_job` / :func:`list_jobs`.
@@ -926,14 +926,16 @@ async def list_events(
     job_id: uuid.UUID,
     after_event_id: int = 0,
     limit: int = 200,
+    kind: EventKind | None = None,
 ) -> list[JobEvent]:
     stmt: Select[tuple[JobEvent]] = (
         select(JobEvent)
         .where(JobEvent.job_id == job_id)
         .where(JobEvent.event_id > after_event_id)
-        .order_by(JobEvent.event_id.asc())
-        .limit(limit)
     )
+    if kind is not None:
+        stmt = stmt.where(JobEvent.kind == kind)
+    stmt = stmt.order_by(JobEvent.event_id.asc()).limit(limit)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
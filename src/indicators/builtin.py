@@ -19,11 +19,18 @@ from __future__ import annotations
 
 import math
 import importlib
+from functools import lru_cache
 from typing import Any, Mapping
 
 
-def _import_talib() -> tuple[Any, Any]:
-    """Return (talib, numpy). Raises ImportError when missing."""
+@lru_cache(maxsize=1)
+def _import_talib() -> tuple[Any, Any, Any]:
+    """Return (talib, talib.abstract, numpy). Raises ImportError when missing.
+
+    설치/기능 검증은 프로세스당 한 번만 수행한다(성공 결과만 캐시되며,
+    ImportError는 캐시되지 않는다). 지표 계산마다 get_functions() 전체 목록을
+    다시 만드는 비용을 없앤다.
+    """
     try:
         import numpy as np  # type: ignore
         import talib  # type: ignore
@@ -46,7 +53,13 @@ def _import_talib() -> tuple[Any, Any]:
             f"(talib_file={talib_path}, talib_version={talib_ver}) "
             "잘못된 패키지(`talib`)가 설치되었을 수 있으니 `TA-Lib` 설치를 확인하세요."
         )
-    return talib, np
+    # `talib.abstract`는 submodule이며, 일부 버전에서는 `talib.abstract` 속성이
+    # `import talib`만으로는 노출되지 않는다. (hasattr(talib, "abstract") == False)
+    try:
+        abstract = importlib.import_module("talib.abstract")
+    except Exception:  # noqa: BLE001
+        abstract = None
+    return talib, abstract, np
 
 
 def _as_float_array(np: Any, values: Any) -> Any:
@@ -88,7 +101,7 @@ def compute(
     Returns:
         float 또는 dict[str, float]
     """
-    talib, np = _import_talib()
+    talib, abstract, np = _import_talib()
 
     if "period" in params and "timeperiod" not in params:
         params["timeperiod"] = params.pop("period")
@@ -100,9 +113,9 @@ def compute(
         raise ValueError("indicator name is required")
 
     try:
-        # `talib.abstract`는 submodule이며, 일부 버전에서는 `talib.abstract` 속성이
-        # `import talib`만으로는 노출되지 않는다. (hasattr(talib, "abstract") == False)
-        abstract = importlib.import_module("talib.abstract")
+        if abstract is None:
+            raise ImportError("talib.abstract is unavailable")
+        # Function 인스턴스는 파라미터/입력을 내부 상태로 보관하므로 호출마다 새로 만든다.
         fn = abstract.Function(normalized_name)
     except Exception as exc:  # noqa: BLE001
         talib_path = getattr(talib, "__file__", None)
@@ -134,7 +134,6 @@ def _resolve_parquet_path(symbol: str) -> Path:
 
 def _download_blob(container_name: str, blob_name: str) -> bytes:
     """Download a blob using the same auth chain as src/common/blob_storage.py."""
-    from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
     from azure.storage.blob import ContainerClient
     conn_str = os.environ.get("AZURE_BLOB_CONNECTION_STRING", "").strip()
     if conn_str:
@@ -146,20 +145,10 @@ def _download_blob(container_name: str, blob_name: str) -> bytes:
                 "OI_PARQUET_BLOB_* set but no AZURE_BLOB_CONNECTION_STRING / "
                 "AZURE_BLOB_ACCOUNT_URL configured."
             )
-        client_id = os.environ.get("AZURE_CLIENT_ID", "").strip()
-        if os.environ.get("IDENTITY_ENDPOINT"):
-            kwargs: dict = {}
-            if client_id:
-                kwargs["client_id"] = client_id
-            credential = ManagedIdentityCredential(**kwargs)
-        else:
-            kwargs = {}
-            if client_id:
-                kwargs["managed_identity_client_id"] = client_id
-            credential = DefaultAzureCredential(**kwargs)
+        from common.blob_storage import default_blob_credential
         client = ContainerClient(account_url=account_url,
                                  container_name=container_name,
-                                 credential=credential)
+                                 credential=default_blob_credential())
     return client.download_blob(blob_name).readall()
 
 
@@ -95,10 +95,12 @@ class LiveRiskManager(BaseRiskManager):
         Returns:
             상태 정보
         """
+        # 거래 기록의 timestamp 는 isoformat 문자열이므로 날짜 접두어만 비교 (행마다 파싱하지 않음)
+        today = datetime.now().date().isoformat()
         return {
             "daily_pnl": self._daily_pnl,
             "daily_loss_limit": self.config.daily_loss_limit,
             "consecutive_losses": self._consecutive_losses,
             "max_consecutive_losses": self.config.max_consecutive_losses,
-            "num_trades_today": len([t for t in self._trade_history if datetime.fromisoformat(t["timestamp"]).date() == datetime.now().date()]),
+            "num_trades_today": sum(1 for t in self._trade_history if t["timestamp"][:10] == today),
         }
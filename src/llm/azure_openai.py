@@ -8,19 +8,20 @@ Auth strategy:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from dataclasses import dataclass
+from typing import AsyncIterator, NoReturn
 
 import httpx
-from azure.core.credentials import TokenCredential
 from azure.core.credentials_async import AsyncTokenCredential
-from azure.identity import ClientSecretCredential, DefaultAzureCredential, get_bearer_token_provider
 from azure.identity.aio import ClientSecretCredential as AsyncClientSecretCredential
 from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
-from azure.identity.aio import get_bearer_token_provider as get_async_bearer_token_provider
-from openai import AsyncOpenAI, OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from llm.config import RelayConfig
 from llm.token_budget import fit_messages
@@ -28,24 +29,65 @@ from llm.token_budget import fit_messages
 logger = logging.getLogger(__name__)
 
 _ALLOWED_RESPONSE_ROLES = {"user", "assistant", "system", "developer"}
+# Shared request fragment; the SDK only serializes it, never mutates it.
+_WEB_SEARCH_TOOLS: list[dict[str, str]] = [{"type": "web_search_preview"}]
+# Prompt caching is automatic, but a hit needs the request to reach a backend
+# that already holds the prefix. System prompts are laid out static-first
+# (interface/template/rules, then per-request examples), so keying on the
+# leading slice routes generate/repair calls that share that prefix together.
+_PROMPT_CACHE_PREFIX_CHARS = 4096
 
 
-def _build_credential(config: RelayConfig) -> TokenCredential:
-    if config.has_client_secret_credential():
-        return ClientSecretCredential(
-            tenant_id=config.azure_tenant_id,
-            client_id=config.azure_client_id,
-            client_secret=config.azure_client_secret,
-        )
+_CredentialKey = tuple[str | None, str | None, str | None, bool]
 
-    kwargs: dict[str, str] = {}
-    if config.azure_client_id:
-        # Supports user-assigned managed identity when AZURE_CLIENT_ID is set.
-        kwargs["managed_identity_client_id"] = config.azure_client_id
-    return DefaultAzureCredential(**kwargs)
+# One credential per auth configuration. azure-identity keeps its token cache
+# on the credential instance, so reusing it means the bearer-token providers of
+# every client share one cached Entra token instead of each new credential
+# round-tripping to AAD. Async credentials hold loop-bound transports, so they
+# are reset together with the async client cache when the running loop changes.
+_async_credentials: dict[_CredentialKey, AsyncTokenCredential] = {}
 
 
-def _build_async_credential(config: RelayConfig) -> AsyncTokenCredential:
+@dataclass(frozen=True, slots=True)
+class _ResolvedAzureCfg:
+    """Endpoint/auth fields of a RelayConfig, resolved once and hashable.
+
+    Doubles as the client cache key, so the per-call path is a single
+    identity check instead of re-normalizing the base URL and re-reading
+    the auth fields on every request.
+    """
+
+    base_url: str
+    credential_key: _CredentialKey
+
+
+_resolved_cfg: tuple[RelayConfig, _ResolvedAzureCfg] | None = None
+
+
+def _resolve_config(config: RelayConfig) -> _ResolvedAzureCfg:
+    global _resolved_cfg
+    cached = _resolved_cfg
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    resolved = _ResolvedAzureCfg(
+        base_url=config.resolved_openai_base_url.rstrip("/") + "/",
+        credential_key=(
+            config.azure_tenant_id,
+            config.azure_client_id,
+            config.azure_client_secret,
+            config.has_client_secret_credential(),
+        ),
+    )
+    # The relay config is a process singleton, so one slot is enough.
+    _resolved_cfg = (config, resolved)
+    return resolved
+
+
+def _credential_key(config: RelayConfig) -> _CredentialKey:
+    return _resolve_config(config).credential_key
+
+
+def _new_async_credential(config: RelayConfig) -> AsyncTokenCredential:
     if config.has_client_secret_credential():
         return AsyncClientSecretCredential(
             tenant_id=config.azure_tenant_id,
@@ -55,29 +97,162 @@ def _build_async_credential(config: RelayConfig) -> AsyncTokenCredential:
 
     kwargs: dict[str, str] = {}
     if config.azure_client_id:
+        # Supports user-assigned managed identity when AZURE_CLIENT_ID is set.
         kwargs["managed_identity_client_id"] = config.azure_client_id
     return AsyncDefaultAzureCredential(**kwargs)
 
 
+def _build_async_credential(config: RelayConfig) -> AsyncTokenCredential:
+    key = _credential_key(config)
+    credential = _async_credentials.get(key)
+    if credential is None:
+        credential = _new_async_credential(config)
+        _async_credentials[key] = credential
+    return credential
+
+
 # Timeout applied to every OpenAI API call (connection + read + write).
 _OPENAI_TIMEOUT = httpx.Timeout(120.0, connect=30.0)
 # Streaming calls may take longer before first token; use a generous read timeout.
 _OPENAI_STREAM_TIMEOUT = httpx.Timeout(300.0, connect=30.0)
 
 _STREAM_MAX_RETRIES = 2
+# Diagnostics for an exhausted empty stream depend only on constants; encode once.
+_EMPTY_STREAM_DIAG = json.dumps({"reason": "empty_stream", "attempts": _STREAM_MAX_RETRIES + 1})
+# Stream deltas are coalesced before being yielded so downstream SSE writers
+# see a few larger chunks instead of one await hop per token. The first delta
+# is yielded immediately; after that the buffer is flushed once it reaches
+# _STREAM_FLUSH_CHARS, or on a timer _STREAM_FLUSH_INTERVAL seconds after the
+# last flush even if the model pauses, so buffered text never waits on the
+# next token.
+_STREAM_FLUSH_CHARS = 2048
+_STREAM_FLUSH_INTERVAL = 0.05
+
+_TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+# Refresh the cached Entra token this many seconds before it expires.
+_TOKEN_REFRESH_MARGIN_SEC = 300
+
+
+class _AsyncCachedTokenProvider:
+    """Bearer-token provider that hands out one AccessToken until near expiry.
+
+    The OpenAI SDK calls its api_key provider before every request. azure-identity's
+    get_bearer_token_provider builds a throwaway pipeline request per call and relies
+    on each credential type caching internally; this returns the cached string
+    directly and only touches the credential when a refresh is due.
+    """
 
+    __slots__ = ("_credential", "_token", "_expires_on", "_lock")
+
+    def __init__(self, credential: AsyncTokenCredential) -> None:
+        self._credential = credential
+        self._token = ""
+        self._expires_on = 0
+        self._lock = asyncio.Lock()
+
+    async def __call__(self) -> str:
+        if time.time() + _TOKEN_REFRESH_MARGIN_SEC < self._expires_on:
+            return self._token
+        async with self._lock:
+            if time.time() + _TOKEN_REFRESH_MARGIN_SEC >= self._expires_on:
+                access_token = await self._credential.get_token(_TOKEN_SCOPE)
+                self._token, self._expires_on = access_token.token, access_token.expires_on
+            return self._token
+
+
+# Process-wide client cache. Building a credential + OpenAI client per call
+# throws away the HTTP connection pool (fresh TLS handshake every request) and
+# the SDK's cached Entra token. Clients are keyed on the config fields that
+# affect auth/endpoint so a config change still yields a fresh client.
+_ClientKey = _ResolvedAzureCfg
+
+# Async clients own an httpx connection pool bound to the event loop that first
+# used it, so they are cached per running loop.
+_async_clients: dict[_ClientKey, AsyncOpenAI] = {}
+_async_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+# All OpenAI clients on a loop share one HTTP transport so concurrent relay
+# callers reuse keep-alive connections to the Azure endpoint instead of each
+# client holding its own pool.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0)
+# HTTP/2 multiplexes concurrent streaming completions over one TLS connection.
+# httpx only supports it with the optional `h2` package (httpx[http2]), so it
+# is enabled when that is installed and HTTP/1.1 keep-alive is used otherwise.
+_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+_async_http_client: httpx.AsyncClient | None = None
+# Close tasks for transports/credentials retired by a loop change, awaited by
+# close_clients() so nothing is left unclosed at shutdown.
+_retired_closes: set[asyncio.Task[None]] = set()
+
+
+def _shared_async_http_client() -> httpx.AsyncClient:
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = DefaultAsyncHttpxClient(
+            limits=_HTTP_LIMITS, timeout=_OPENAI_TIMEOUT, http2=_HTTP2_ENABLED
+        )
+    return _async_http_client
 
-def _create_client(config: RelayConfig) -> OpenAI:
-    credential = _build_credential(config)
-    token_provider = get_bearer_token_provider(
-        credential,
-        "https://cognitiveservices.azure.com/.default",
-    )
-    return OpenAI(
-        base_url=config.resolved_openai_base_url.rstrip("/") + "/",
-        api_key=token_provider,
-        timeout=_OPENAI_TIMEOUT,
-    )
+
+def _client_key(config: RelayConfig) -> _ClientKey:
+    return _resolve_config(config)
+
+
+async def _close_quietly(resource: httpx.AsyncClient | AsyncTokenCredential) -> None:
+    try:
+        if isinstance(resource, httpx.AsyncClient):
+            await resource.aclose()
+        else:
+            await resource.close()
+    except Exception:  # noqa: BLE001
+        logger.debug("Failed to close retired OpenAI transport/credential", exc_info=True)
+
+
+def _retire_async_clients(old_loop: asyncio.AbstractEventLoop | None) -> None:
+    """Drop the previous loop's clients and close their transport and credentials.
+
+    The close runs on the old loop when it is still running in another thread,
+    otherwise on the current loop (socket cleanup is best-effort there).
+    """
+    global _async_http_client
+    resources: list[httpx.AsyncClient | AsyncTokenCredential] = list(_async_credentials.values())
+    if _async_http_client is not None:
+        resources.append(_async_http_client)
+    _async_clients.clear()
+    _async_credentials.clear()
+    _async_http_client = None
+    if not resources:
+        return
+    if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+        for resource in resources:
+            asyncio.run_coroutine_threadsafe(_close_quietly(resource), old_loop)
+        return
+    loop = asyncio.get_running_loop()
+    for resource in resources:
+        task = loop.create_task(_close_quietly(resource))
+        _retired_closes.add(task)
+        task.add_done_callback(_retired_closes.discard)
+
+
+def _get_async_client(config: RelayConfig) -> AsyncOpenAI:
+    global _async_clients_loop
+    loop = asyncio.get_running_loop()
+    if _async_clients_loop is not loop:
+        # Pools from a previous loop cannot be reused.
+        _retire_async_clients(_async_clients_loop)
+        _async_clients_loop = loop
+    key = _client_key(config)
+    client = _async_clients.get(key)
+    if client is None:
+        client = AsyncOpenAI(
+            base_url=key.base_url,
+            api_key=_AsyncCachedTokenProvider(_build_async_credential(config)),
+            timeout=_OPENAI_TIMEOUT,
+            http_client=_shared_async_http_client(),
+        )
+        _async_clients[key] = client
+    return client
 
 
 @asynccontextmanager
@@ -85,26 +260,49 @@ async def _create_async_client(
     config: RelayConfig,
     timeout: httpx.Timeout | None = None,
 ):
-    credential = _build_async_credential(config)
-    token_provider = get_async_bearer_token_provider(
-        credential,
-        "https://cognitiveservices.azure.com/.default",
-    )
-    client = AsyncOpenAI(
-        base_url=config.resolved_openai_base_url.rstrip("/") + "/",
-        api_key=token_provider,
-        timeout=timeout or _OPENAI_TIMEOUT,
-    )
-    try:
-        yield client
-    finally:
-        await client.close()
-        await credential.close()
+    client = _get_async_client(config)
+    # with_options() returns a lightweight copy that shares the cached
+    # client's connection pool; only the per-call timeout differs.
+    yield client.with_options(timeout=timeout) if timeout is not None else client
+
+
+def get_stream_client(config: RelayConfig) -> AsyncOpenAI:
+    """Pooled AsyncOpenAI client with the streaming timeout, for callers that drive
+    the Responses API directly (e.g. the agent tool loop)."""
+    return _get_async_client(config).with_options(timeout=_OPENAI_STREAM_TIMEOUT)
+
+
+async def close_clients() -> None:
+    """Close cached clients/credentials (call on application shutdown)."""
+    global _async_http_client
+    async_clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in async_clients:
+        try:
+            await client.close()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to close cached OpenAI client", exc_info=True)
+    async_http_client, _async_http_client = _async_http_client, None
+    if async_http_client is not None:
+        await async_http_client.aclose()
+    async_credentials = list(_async_credentials.values())
+    _async_credentials.clear()
+    for async_credential in async_credentials:
+        try:
+            await async_credential.close()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to close cached credential", exc_info=True)
+    if _retired_closes:
+        await asyncio.gather(*_retired_closes, return_exceptions=True)
+
+
+# Exact types returned as-is by _serialize_diagnostic without further probing.
+_DIAGNOSTIC_PASSTHROUGH_TYPES = frozenset({type(None), dict, list, str, int, float, bool})
 
 
 def _serialize_diagnostic(value: object) -> object:
-    if value is None:
-        return None
+    if type(value) in _DIAGNOSTIC_PASSTHROUGH_TYPES:
+        return value
     if hasattr(value, "model_dump"):
         try:
             return value.model_dump(exclude_none=True)  # type: ignore[attr-defined]
@@ -140,6 +338,11 @@ def _build_response_input(
     return [{"role": "user", "content": (user_content or "").strip()}]
 
 
+def _prompt_cache_key(system_content: str) -> str:
+    prefix = system_content[:_PROMPT_CACHE_PREFIX_CHARS]
+    return "sys-" + hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
+
+
 def _build_response_kwargs(
     config: RelayConfig,
     system_content: str,
@@ -165,18 +368,20 @@ def _build_response_kwargs(
 
     kwargs: dict[str, object] = {
         "model": resolved_model,
-        "instructions": system_content,
         "input": _build_response_input(user_content=user_content, messages=messages),
     }
     kwargs["max_output_tokens"] = max_output_tokens
+    # An empty system prompt (e.g. the connection test) is omitted rather than
+    # sent as blank instructions.
+    if system_content:
+        kwargs["instructions"] = system_content
+        kwargs["prompt_cache_key"] = _prompt_cache_key(system_content)
     if stream:
         kwargs["stream"] = True
     if text_format:
         kwargs["text"] = {"format": text_format}
     if enable_web_search:
-        tools = list(kwargs.get("tools") or [])  # type: ignore[arg-type]
-        tools.append({"type": "web_search_preview"})
-        kwargs["tools"] = tools
+        kwargs["tools"] = _WEB_SEARCH_TOOLS
     return kwargs
 
 
@@ -258,6 +463,11 @@ def _raise_empty_completion(response: object) -> None:
     raise ValueError(f"Empty completion from model. diagnostics={detail_text}")
 
 
+def _raise_empty_stream(last_error: Exception | None) -> NoReturn:
+    logger.warning("LLM returned empty stream after retries: %s", _EMPTY_STREAM_DIAG)
+    raise last_error or ValueError(f"Empty streamed completion from model. diagnostics={_EMPTY_STREAM_DIAG}")
+
+
 async def chat_completion_stream(
     config: RelayConfig,
     system_content: str,
@@ -285,20 +495,67 @@ async def chat_completion_stream(
 
     accumulated: list[str] = []
     last_error: Exception | None = None
+    clock = asyncio.get_running_loop().time
     for attempt in range(_STREAM_MAX_RETRIES + 1):
         emitted = False
         final_text: str | None = None
+        pending: list[str] = []
+        pending_chars = 0
+        last_flush = clock()
+        next_event: asyncio.Future | None = None
         try:
             async with _create_async_client(config, timeout=_OPENAI_STREAM_TIMEOUT) as client:
                 stream = await client.responses.create(**request_kwargs)
-                async for event in stream:
-                    event_type = getattr(event, "type", None)
-                    if event_type == "response.output_text.delta" and getattr(event, "delta", None):
-                        emitted = True
-                        accumulated.append(event.delta)
-                        yield event.delta
-                    elif event_type == "response.output_text.done" and getattr(event, "text", None):
-                        final_text = event.text
+                events = stream.__aiter__()
+                try:
+                    while True:
+                        if next_event is None:
+                            next_event = asyncio.ensure_future(events.__anext__())
+                        if pending:
+                            # Wait for the next event only until the flush deadline; the
+                            # read itself is never cancelled, it keeps running across flushes.
+                            remaining = _STREAM_FLUSH_INTERVAL - (clock() - last_flush)
+                            if remaining > 0:
+                                await asyncio.wait((next_event,), timeout=remaining)
+                            if not next_event.done():
+                                yield "".join(pending)
+                                pending.clear()
+                                pending_chars = 0
+                                last_flush = clock()
+                                continue
+                        try:
+                            event = await next_event
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            next_event = None
+                        event_type = getattr(event, "type", None)
+                        if event_type == "response.output_text.delta":
+                            delta = getattr(event, "delta", None)
+                            if not delta:
+                                continue
+                            accumulated.append(delta)
+                            pending.append(delta)
+                            pending_chars += len(delta)
+                            now = clock()
+                            if (
+                                not emitted
+                                or pending_chars >= _STREAM_FLUSH_CHARS
+                                or now - last_flush >= _STREAM_FLUSH_INTERVAL
+                            ):
+                                yield "".join(pending)
+                                pending.clear()
+                                pending_chars = 0
+                                last_flush = now
+                            emitted = True
+                        elif event_type == "response.output_text.done" and getattr(event, "text", None):
+                            final_text = event.text
+                finally:
+                    if next_event is not None and not next_event.done():
+                        next_event.cancel()
+            if pending:
+                yield "".join(pending)
+                pending.clear()
             if emitted:
                 # Check if continuation is needed
                 if enable_continuation:
@@ -314,6 +571,9 @@ async def chat_completion_stream(
             last_error = ValueError("Empty streamed completion from model")
         except Exception as exc:
             last_error = exc
+            if pending:
+                yield "".join(pending)
+                pending.clear()
             if emitted:
                 # Already yielded tokens — cannot safely retry.
                 # But still try continuation if enabled
@@ -339,12 +599,31 @@ async def chat_completion_stream(
             )
             await asyncio.sleep(wait)
 
-    diag = {"reason": "empty_stream", "attempts": _STREAM_MAX_RETRIES + 1}
-    logger.warning("LLM returned empty stream after retries: %s", json.dumps(diag, ensure_ascii=False))
-    raise last_error or ValueError(f"Empty streamed completion from model. diagnostics={json.dumps(diag)}")
+    _raise_empty_stream(last_error)
+
+
+def _log_prompt_cache_usage(response: object) -> None:
+    """Log how much of the input was served from the prompt cache (prefix hit check)."""
+    usage = _get_attr(response, "usage")
+    input_tokens = _get_attr(usage, "input_tokens")
+    cached_tokens = _get_attr(_get_attr(usage, "input_tokens_details"), "cached_tokens")
+    logger.debug("Prompt cache usage: cached=%s input=%s", cached_tokens, input_tokens)
+
+
+def _completion_result(config: RelayConfig, response: object) -> tuple[str, str]:
+    content = _extract_response_output_text(response)
+    if not content:
+        _raise_empty_completion(response)
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_prompt_cache_usage(response)
+    try:
+        model_used = response.model or config.resolved_openai_model  # type: ignore[attr-defined]
+    except AttributeError:
+        model_used = config.resolved_openai_model
+    return content, model_used
 
 
-def chat_completion(
+async def chat_completion_async(
     config: RelayConfig,
     system_content: str,
     user_content: str,
@@ -363,17 +642,12 @@ def chat_completion(
         enable_web_search=enable_web_search,
     )
 
-    client = _create_client(config)
-    response = client.responses.create(**request_kwargs)
-
-    content = _extract_response_output_text(response)
-    if not content:
-        _raise_empty_completion(response)
-    model_used = getattr(response, "model", None) or config.resolved_openai_model
-    return content, model_used
+    async with _create_async_client(config) as client:
+        response = await client.responses.create(**request_kwargs)
+    return _completion_result(config, response)
 
 
-def chat_completion_messages(
+async def chat_completion_messages_async(
     config: RelayConfig,
     system_content: str,
     messages: list[dict[str, str]],
@@ -390,14 +664,9 @@ def chat_completion_messages(
         enable_web_search=enable_web_search,
     )
 
-    client = _create_client(config)
-    response = client.responses.create(**request_kwargs)
-
-    content = _extract_response_output_text(response)
-    if not content:
-        _raise_empty_completion(response)
-    model_used = getattr(response, "model", None) or config.resolved_openai_model
-    return content, model_used
+    async with _create_async_client(config) as client:
+        response = await client.responses.create(**request_kwargs)
+    return _completion_result(config, response)
 
 
 def _looks_like_truncated_code(text: str) -> bool:
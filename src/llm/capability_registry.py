@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 SUPPORTED_DATA_SOURCES: tuple[str, ...] = (
@@ -135,15 +137,45 @@ CONTEXT_EXTENSION_REQUIREMENTS: tuple[tuple[str, str], ...] = (
 )
 
 
+# Every keyword/token the detectors look for, lowercased once. A request text
+# is scanned against this set a single time (see _matched_keywords) and the
+# three detectors below only do set lookups on the result.
+_SCAN_KEYWORDS: tuple[str, ...] = tuple(
+    dict.fromkeys(
+        [kw.lower() for rule in UNSUPPORTED_CAPABILITY_RULES for kw in rule.keywords]
+        + [token.lower() for token, _ in UNSUPPORTED_CONTEXT_METHOD_HINTS]
+        + [token.lower() for token, _ in CONTEXT_EXTENSION_REQUIREMENTS]
+    )
+)
+
+# Reject filter for the common case of a prompt with no trigger keyword: one
+# C-level regex pass instead of a substring scan per keyword.
+_SCAN_PREFILTER = re.compile("|".join(re.escape(kw) for kw in _SCAN_KEYWORDS))
+
+
+@lru_cache(maxsize=32)
+def _matched_keywords(normalized: str) -> frozenset[str]:
+    """Keywords present in already-lowercased text.
+
+    Cached because intake runs detect_unsupported_requirements and
+    build_development_requirements (which itself calls
+    detect_unsupported_categories) on the same conversation text.
+    """
+    if _SCAN_PREFILTER.search(normalized) is None:
+        return frozenset()
+    return frozenset(kw for kw in _SCAN_KEYWORDS if kw in normalized)
+
+
 def detect_unsupported_categories(text: str) -> list[str]:
     """Detect unsupported capability category names from free-form text."""
     normalized = (text or "").lower()
     if not normalized:
         return []
 
+    matched = _matched_keywords(normalized)
     out: list[str] = []
     for rule in UNSUPPORTED_CAPABILITY_RULES:
-        if any(keyword in normalized for keyword in rule.keywords):
+        if not matched.isdisjoint(rule.keywords):
             if rule.name not in out:
                 out.append(rule.name)
     return out
@@ -155,14 +187,15 @@ def detect_unsupported_requirements(text: str) -> list[str]:
     if not normalized:
         return []
 
+    matched = _matched_keywords(normalized)
     found: list[str] = []
     for rule in UNSUPPORTED_CAPABILITY_RULES:
-        if any(keyword in normalized for keyword in rule.keywords):
+        if not matched.isdisjoint(rule.keywords):
             if rule.user_message not in found:
                 found.append(rule.user_message)
 
     for token, message in UNSUPPORTED_CONTEXT_METHOD_HINTS:
-        if token.lower() in normalized and message not in found:
+        if token.lower() in matched and message not in found:
             found.append(message)
 
     return found
@@ -174,6 +207,7 @@ def build_development_requirements(text: str) -> list[str]:
     if not normalized:
         return []
 
+    matched = _matched_keywords(normalized)
     out: list[str] = []
     for category in detect_unsupported_categories(normalized):
         label = CAPABILITY_CATEGORY_LABELS.get(category, category)
@@ -184,7 +218,7 @@ def build_development_requirements(text: str) -> list[str]:
                 out.append(line)
 
     for token, requirement in CONTEXT_EXTENSION_REQUIREMENTS:
-        if token.lower() in normalized:
+        if token.lower() in matched:
             line = f"[런타임 확장] {requirement}"
             if line not in out:
                 out.append(line)
@@ -192,28 +226,29 @@ def build_development_requirements(text: str) -> list[str]:
     return out
 
 
+# Both outputs depend only on the module-level tuples above, so they are
+# rendered once at import instead of re-joined on every intake request.
+_CAPABILITY_SUMMARY_LINES: tuple[str, ...] = (
+    f"지원 데이터 소스: {', '.join(SUPPORTED_DATA_SOURCES)}",
+    f"지원 인디케이터 범위: {', '.join(SUPPORTED_INDICATOR_SCOPES)}",
+    f"지원 StrategyContext 항목: {', '.join(SUPPORTED_CONTEXT_METHODS)}",
+)
+
+_CAPABILITY_PROMPT_FRAGMENT: str = (
+    "Current capability registry:\n"
+    f"- Supported data sources: {'; '.join(SUPPORTED_DATA_SOURCES)}\n"
+    f"- Supported indicator scope: {'; '.join(SUPPORTED_INDICATOR_SCOPES)}\n"
+    f"- Supported StrategyContext methods: {', '.join(SUPPORTED_CONTEXT_METHODS)}\n"
+    "- Unsupported capability categories (without extra infra): "
+    f"{', '.join(rule.name for rule in UNSUPPORTED_CAPABILITY_RULES)}"
+)
+
+
 def capability_summary_lines() -> list[str]:
     """Human-readable capability summary lines."""
-    methods = ", ".join(SUPPORTED_CONTEXT_METHODS)
-    data_sources = ", ".join(SUPPORTED_DATA_SOURCES)
-    indicators = ", ".join(SUPPORTED_INDICATOR_SCOPES)
-    return [
-        f"지원 데이터 소스: {data_sources}",
-        f"지원 인디케이터 범위: {indicators}",
-        f"지원 StrategyContext 항목: {methods}",
-    ]
+    return list(_CAPABILITY_SUMMARY_LINES)
 
 
 def capability_prompt_fragment() -> str:
     """Prompt fragment for injecting capability boundaries."""
-    supported_data = "; ".join(SUPPORTED_DATA_SOURCES)
-    supported_indicators = "; ".join(SUPPORTED_INDICATOR_SCOPES)
-    methods = ", ".join(SUPPORTED_CONTEXT_METHODS)
-    unsupported_names = ", ".join(rule.name for rule in UNSUPPORTED_CAPABILITY_RULES)
-    return (
-        "Current capability registry:\n"
-        f"- Supported data sources: {supported_data}\n"
-        f"- Supported indicator scope: {supported_indicators}\n"
-        f"- Supported StrategyContext methods: {methods}\n"
-        f"- Unsupported capability categories (without extra infra): {unsupported_names}"
-    )
+    return _CAPABILITY_PROMPT_FRAGMENT
@@ -6,13 +6,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
-from llm.azure_openai import chat_completion, chat_completion_messages, chat_completion_stream
 from llm.capability_registry import (
     SUPPORTED_CONTEXT_METHODS,
     SUPPORTED_DATA_SOURCES,
@@ -33,6 +36,45 @@ from llm.url_fetcher import enrich_messages_with_url_content
 
 logger = logging.getLogger(__name__)
 
+# 인테이크 응답 정리(JSON 파싱, 정규식 탐지, 중복 제거)는 순수 CPU 작업이라
+# 대화가 길어지면 이벤트 루프를 막는다. 이 크기를 넘는 입력만 스레드로 넘기고,
+# 작은 입력은 스레드 전환 비용이 더 크므로 그대로 처리한다.
+_INTAKE_OFFLOAD_CHARS = 4096
+
+# 동일 입력에 대한 요약/백테스트 분석 응답 캐시(정확 일치).
+# 같은 전략·같은 백테스트 결과로 분석을 다시 누르는 경우 Azure 왕복과 토큰 비용을
+# 생략한다. 대화형 채팅/생성은 매번 새 응답이 기대되므로 대상이 아니다.
+_RESPONSE_CACHE_MAX_ENTRIES = 64
+_RESPONSE_CACHE_TTL_SEC = 3600.0
+_response_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+
+def _response_cache_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _response_cache_get(key: str) -> Any | None:
+    cached = _response_cache.get(key)
+    if cached is None:
+        return None
+    ts, value = cached
+    if time.monotonic() - ts > _RESPONSE_CACHE_TTL_SEC:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return value
+
+
+def _response_cache_put(key: str, value: Any) -> None:
+    _response_cache[key] = (time.monotonic(), value)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
 
 @dataclass
 class StrategyGenerationResult:
@@ -112,14 +154,24 @@ class LLMClient:
         """전략 코드 요약."""
         if not code or not code.strip():
             return None
+        model = self._config.resolved_summarizer_model
+        cache_key = _response_cache_key("summary", model, code.strip())
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            content, _ = chat_completion(
+            from llm.azure_openai import chat_completion_async
+
+            content, _ = await chat_completion_async(
                 self._config,
                 system_content=SUMMARY_SYSTEM_PROMPT,
                 user_content=code.strip(),
-                model=self._config.resolved_summarizer_model,
+                model=model,
             )
-            return content.strip() if content else None
+            summary_text = content.strip() if content else None
+            if summary_text:
+                _response_cache_put(cache_key, summary_text)
+            return summary_text
         except Exception:
             logger.warning("summarize_strategy failed", exc_info=True)
             return None
@@ -134,9 +186,11 @@ class LLMClient:
         if not messages:
             return None
         try:
+            from llm.azure_openai import chat_completion_messages_async
+
             enriched = await enrich_messages_with_url_content(messages)
             system_content = build_strategy_chat_system_prompt(code or "", summary)
-            content, _ = chat_completion_messages(
+            content, _ = await chat_completion_messages_async(
                 self._config,
                 system_content=system_content,
                 messages=enriched,
@@ -161,6 +215,8 @@ class LLMClient:
             return
 
         try:
+            from llm.azure_openai import chat_completion_stream
+
             enriched = await enrich_messages_with_url_content(messages)
             system_content = build_strategy_chat_system_prompt(code or "", summary)
             acc: list[str] = []
@@ -201,20 +257,32 @@ class LLMClient:
         if summary:
             user_content += f"\n\nStrategy summary:\n{summary}"
 
+        model = self._config.resolved_analyst_model
+        cache_key = _response_cache_key("analysis", model, user_content)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            # 호출 측이 결과 dict를 수정해도 캐시가 오염되지 않도록 복사해 반환.
+            return dict(cached)
         try:
-            content, _ = chat_completion(
+            from llm.azure_openai import chat_completion_async
+
+            content, _ = await chat_completion_async(
                 self._config,
                 system_content=build_analyst_system_prompt(),
                 user_content=user_content,
-                model=self._config.resolved_analyst_model,
+                model=model,
                 text_format={"type": "json_object"},
             )
             if not content or not content.strip():
                 return None
             try:
-                return json.loads(content.strip())
+                analysis = json.loads(content.strip())
             except json.JSONDecodeError:
-                return {"raw_analysis": content.strip()}
+                analysis = {"raw_analysis": content.strip()}
+            if isinstance(analysis, dict):
+                _response_cache_put(cache_key, analysis)
+                return dict(analysis)
+            return analysis
         except Exception:
             logger.warning("analyze_backtest failed", exc_info=True)
             return None
@@ -229,15 +297,27 @@ class LLMClient:
             return None
 
         try:
+            from llm.generate import _is_bare_generic_strategy_prompt, _sanitize_intake_response
+
+            # "전략 만들어줘" 한 마디뿐인 단발 요청은 모델이 뽑아낼 조건이 없으므로
+            # Azure 호출 없이 entry_logic 보완 질문으로 바로 돌려준다.
+            # 뒤에 조건이 붙은 요청("전략 만들어줘: RSI 30 ...")은 모델로 보낸다.
+            if not messages and _is_bare_generic_strategy_prompt(user_prompt):
+                return _sanitize_intake_response(
+                    {}, prompt=user_prompt.strip(), messages=[]
+                ).model_dump()
+
+            from llm.azure_openai import chat_completion_async, chat_completion_messages_async
+
             system_content = build_intake_system_prompt()
             if messages:
-                content, _ = chat_completion_messages(
+                content, _ = await chat_completion_messages_async(
                     self._config,
                     system_content=system_content,
                     messages=messages,
                 )
             else:
-                content, _ = chat_completion(
+                content, _ = await chat_completion_async(
                     self._config,
                     system_content=system_content,
                     user_content=(user_prompt or "").strip(),
@@ -245,19 +325,32 @@ class LLMClient:
             if not content or not content.strip():
                 return None
 
-            from llm.generate import _extract_json_object, _sanitize_intake_response, ChatMessage
+            from llm.generate import _extract_json_object, ChatMessage
 
-            payload = _extract_json_object(content) or {}
+            if len(content) > _INTAKE_OFFLOAD_CHARS:
+                payload = await asyncio.to_thread(_extract_json_object, content) or {}
+            else:
+                payload = _extract_json_object(content) or {}
             chat_messages = (
                 [ChatMessage(role=m["role"], content=m["content"]) for m in messages]
                 if messages
                 else []
             )
-            result = _sanitize_intake_response(
-                payload,
-                prompt=(user_prompt or "").strip(),
-                messages=chat_messages,
-            )
+            prompt = (user_prompt or "").strip()
+            conversation_chars = len(prompt) + sum(len(m.content or "") for m in chat_messages)
+            if conversation_chars > _INTAKE_OFFLOAD_CHARS:
+                result = await asyncio.to_thread(
+                    _sanitize_intake_response,
+                    payload,
+                    prompt=prompt,
+                    messages=chat_messages,
+                )
+            else:
+                result = _sanitize_intake_response(
+                    payload,
+                    prompt=prompt,
+                    messages=chat_messages,
+                )
             return result.model_dump() if hasattr(result, "model_dump") else dict(result)
         except Exception:
             logger.warning("intake_strategy failed", exc_info=True)
@@ -307,7 +400,9 @@ class LLMClient:
         prompt_parts.extend(["", "Current code:", code.strip()])
 
         try:
-            content, model_used = chat_completion(
+            from llm.azure_openai import chat_completion_async
+
+            content, model_used = await chat_completion_async(
                 self._config,
                 system_content=build_repair_system_prompt(),
                 user_content="\n".join(prompt_parts),
@@ -325,8 +420,8 @@ class LLMClient:
         messages: list[dict[str, str]] | None = None,
         confirmed_plan: dict[str, Any] | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
-        """전략 코드 생성 스트리밍 — relay _generate_stream_body 직접 호출."""
-        from llm.generate import StrategyRequest, ChatMessage as RelayChatMessage, _generate_stream_body
+        """전략 코드 생성 스트리밍 — relay _generate_stream_events 직접 호출."""
+        from llm.generate import StrategyRequest, ChatMessage as RelayChatMessage, _generate_stream_events
 
         relay_messages = (
             [RelayChatMessage(role=m["role"], content=m["content"]) for m in messages]
@@ -340,17 +435,11 @@ class LLMClient:
         )
 
         try:
-            async for sse_line in _generate_stream_body(body):
-                # _generate_stream_body yields SSE formatted strings: "data: {...}\n\n"
-                line = sse_line.strip()
-                if line.startswith("data: "):
-                    try:
-                        data = json.loads(line[6:])
-                        yield data
-                        if data.get("done") or data.get("error"):
-                            return
-                    except json.JSONDecodeError:
-                        pass
+            # 이벤트 dict를 그대로 전달한다 — SSE 직렬화는 API 레이어에서 한 번만 수행.
+            async for event in _generate_stream_events(body):
+                yield event
+                if event.get("done") or event.get("error"):
+                    return
         except Exception as e:
             logger.exception("generate_strategy_stream failed: %s", e)
             yield {"error": str(e)}
@@ -359,7 +448,9 @@ class LLMClient:
         """LLM 연결 테스트."""
         text = (input_text or "").strip() or "Hello"
         try:
-            content, _ = chat_completion(
+            from llm.azure_openai import chat_completion_async
+
+            content, _ = await chat_completion_async(
                 self._config,
                 system_content=TEST_SYSTEM_PROMPT,
                 user_content=text,
@@ -1,11 +1,25 @@
 """LLM module configuration from environment."""
 
 import os
+from functools import lru_cache
 
-from pydantic import AliasChoices, Field
+from pydantic import AliasChoices, Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Field -> env vars consulted when the field itself is empty (e.g. OPENAI_MODEL
+# set to "" while AZURE_OPENAI_MODEL carries the real value).
+_ENV_FALLBACKS: dict[str, tuple[str, ...]] = {
+    "openai_base_url": ("OPENAI_BASE_URL", "AZURE_OPENAI_BASE_URL"),
+    "openai_model": ("OPENAI_MODEL", "AZURE_OPENAI_MODEL"),
+    "planner_model": ("PLANNER_MODEL", "AZURE_OPENAI_PLANNER_MODEL"),
+    "coder_model": ("CODER_MODEL", "AZURE_OPENAI_CODER_MODEL"),
+    "reviewer_model": ("REVIEWER_MODEL", "AZURE_OPENAI_REVIEWER_MODEL"),
+    "analyst_model": ("ANALYST_MODEL", "AZURE_OPENAI_ANALYST_MODEL"),
+    "summarizer_model": ("SUMMARIZER_MODEL", "AZURE_OPENAI_SUMMARIZER_MODEL"),
+}
+
+
 class RelayConfig(BaseSettings):
     """Environment-based config for the v1 Azure OpenAI relay."""
 
@@ -47,8 +61,12 @@ class RelayConfig(BaseSettings):
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    # Predicates derived in _normalize; the config is not mutated after load.
+    _has_client_secret: bool = PrivateAttr(default=False)
+    _azure_configured: bool = PrivateAttr(default=False)
+
     def has_client_secret_credential(self) -> bool:
-        return bool(self.azure_tenant_id and self.azure_client_id and self.azure_client_secret)
+        return self._has_client_secret
 
     @staticmethod
     def _first_env_value(*names: str) -> str:
@@ -58,66 +76,51 @@ class RelayConfig(BaseSettings):
                 return value
         return ""
 
+    @model_validator(mode="after")
+    def _normalize(self) -> "RelayConfig":
+        # Strip values and apply env-var fallbacks once at construction so the
+        # resolved_* accessors on the request path are plain attribute reads.
+        for field_name, env_names in _ENV_FALLBACKS.items():
+            value = getattr(self, field_name).strip() or self._first_env_value(*env_names)
+            setattr(self, field_name, value)
+        self._has_client_secret = bool(
+            self.azure_tenant_id and self.azure_client_id and self.azure_client_secret
+        )
+        self._azure_configured = bool(self.openai_model and self.openai_base_url)
+        return self
+
     @property
     def resolved_openai_base_url(self) -> str:
-        configured = self.openai_base_url.strip()
-        if configured:
-            return configured
-        return self._first_env_value("OPENAI_BASE_URL", "AZURE_OPENAI_BASE_URL")
+        return self.openai_base_url
 
     @property
     def resolved_openai_model(self) -> str:
-        configured = self.openai_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("OPENAI_MODEL", "AZURE_OPENAI_MODEL")
+        return self.openai_model
 
     @property
     def resolved_planner_model(self) -> str:
-        configured = self.planner_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("PLANNER_MODEL", "AZURE_OPENAI_PLANNER_MODEL") or self.resolved_openai_model
+        return self.planner_model or self.openai_model
 
     @property
     def resolved_coder_model(self) -> str:
-        configured = self.coder_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("CODER_MODEL", "AZURE_OPENAI_CODER_MODEL") or self.resolved_openai_model
+        return self.coder_model or self.openai_model
 
     @property
     def resolved_reviewer_model(self) -> str:
-        configured = self.reviewer_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("REVIEWER_MODEL", "AZURE_OPENAI_REVIEWER_MODEL") or self.resolved_openai_model
+        return self.reviewer_model or self.openai_model
 
     @property
     def resolved_analyst_model(self) -> str:
-        configured = self.analyst_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("ANALYST_MODEL", "AZURE_OPENAI_ANALYST_MODEL") or self.resolved_openai_model
+        return self.analyst_model or self.openai_model
 
     @property
     def resolved_summarizer_model(self) -> str:
-        configured = self.summarizer_model.strip()
-        if configured:
-            return configured
-        return self._first_env_value("SUMMARIZER_MODEL", "AZURE_OPENAI_SUMMARIZER_MODEL") or self.resolved_openai_model
+        return self.summarizer_model or self.openai_model
 
     def is_azure_configured(self) -> bool:
-        if not self.resolved_openai_model:
-            return False
-        return bool(self.resolved_openai_base_url)
-
-
-_config: RelayConfig | None = None
+        return self._azure_configured
 
 
+@lru_cache(maxsize=1)
 def get_config() -> RelayConfig:
-    global _config
-    if _config is None:
-        _config = RelayConfig()
-    return _config
+    return RelayConfig()
@@ -7,14 +7,16 @@ streaming generation pipeline and supporting helpers used by LLMClient.
 from __future__ import annotations
 
 import ast
+import itertools
 import json
 import logging
 import re
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
 from pydantic import BaseModel
 
-from llm.azure_openai import chat_completion, chat_completion_stream
+from llm.azure_openai import chat_completion_async, chat_completion_stream
 from llm.capability_registry import (
     build_development_requirements,
     capability_summary_lines,
@@ -73,14 +75,29 @@ _ALLOWED_STATUSES = {
     "UNSUPPORTED_CAPABILITY",
     "OUT_OF_SCOPE",
 }
-_GENERIC_REQUEST_PATTERNS = [
-    r"^전략\s*생성",
-    r"^전략\s*만들",
-    r"전략.*아무거나",
-    r"아무거나.*전략",
-    r"알아서.*전략",
-    r"strategy\s*(please|generate|create)?\s*$",
-]
+_GENERIC_REQUEST_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"^전략\s*생성",
+            r"^전략\s*만들",
+            r"전략.*아무거나",
+            r"아무거나.*전략",
+            r"알아서.*전략",
+            r"strategy\s*(please|generate|create)?\s*$",
+        )
+    )
+)
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]")
+# Matched in full against the prompt with _NON_WORD_RE stripped: the generic
+# phrase alone ("전략 만들어줘", "아무거나 전략 하나"), with no conditions after it.
+_BARE_GENERIC_REQUEST_RE = re.compile(
+    r"(?:(?:아무거나|알아서)(?:하나|좀)?)?전략(?:하나|좀|아무거나)?(?:(?:만들|생성)[가-힣]{0,4})?"
+    r"|strategy(?:please|generate|create)?"
+)
+# DSL code is complete before it is sent; replay it in frames of this size so the
+# UI still renders it progressively instead of as one block.
+_CODE_FRAME_CHARS = 256
 
 _NON_TRADING_REJECTION_MSG = (
     "죄송합니다. 이 요청은 트레이딩 전략과 관련이 없어 처리할 수 없습니다. "
@@ -135,6 +152,22 @@ _QUESTION_CATEGORY_KEYWORDS = {
         "청산", "익절", "손절", "종료",
     ),
 }
+# One alternation per category, checked in dict order so category priority is kept.
+# Keywords go through the same normalization as the questions they are matched
+# against (_normalize_text), so a keyword with a space or punctuation still hits.
+_QUESTION_CATEGORY_RES = tuple(
+    (
+        category,
+        re.compile(
+            "|".join(
+                re.escape(keyword)
+                for keyword in dict.fromkeys(_NON_WORD_RE.sub("", kw.lower()) for kw in keywords)
+                if keyword
+            )
+        ),
+    )
+    for category, keywords in _QUESTION_CATEGORY_KEYWORDS.items()
+)
 
 
 # ---------------------------------------------------------------------------
@@ -149,28 +182,20 @@ def _is_model_refusal(text: str) -> bool:
     return any(p.search(stripped) for p in _MODEL_REFUSAL_PATTERNS)
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _extract_json_object(content: str) -> dict[str, Any] | None:
     text = (content or "").strip()
     if not text:
         return None
-    if text.startswith("```"):
-        parts = text.split("```")
-        if len(parts) >= 3:
-            text = parts[1].strip()
-            if text.lower().startswith("json"):
-                text = text[4:].strip()
-    try:
-        parsed = json.loads(text)
-        return parsed if isinstance(parsed, dict) else None
-    except json.JSONDecodeError:
-        pass
-
     start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end <= start:
+    if start == -1:
         return None
+    # Decode the first complete value from the first "{" in place; prose or a
+    # ```json fence before the object and anything after it are skipped.
     try:
-        parsed = json.loads(text[start : end + 1])
+        parsed, _ = _JSON_DECODER.raw_decode(text, start)
     except json.JSONDecodeError:
         return None
     return parsed if isinstance(parsed, dict) else None
@@ -187,28 +212,29 @@ def _to_str_list(raw: Any) -> list[str]:
     return out
 
 
-def _unique_preserve_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
+def _unique_str_list(raw: Any) -> list[str]:
+    """_to_str_list with duplicates dropped, first occurrence kept."""
+    return list(dict.fromkeys(_to_str_list(raw)))
+
+
+def _extend_unique(target: list[str], values: Iterable[str]) -> None:
+    seen = set(target)
     for value in values:
-        item = value.strip()
-        if not item or item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+        if value not in seen:
+            seen.add(value)
+            target.append(value)
 
 
 def _normalize_text(value: str) -> str:
-    return re.sub(r"[^0-9a-z가-힣]", "", (value or "").lower())
+    return _NON_WORD_RE.sub("", (value or "").lower())
 
 
 def _question_category(question: str) -> str | None:
     normalized = _normalize_text(question)
     if not normalized:
         return None
-    for category, keywords in _QUESTION_CATEGORY_KEYWORDS.items():
-        if any(keyword in normalized for keyword in keywords):
+    for category, pattern in _QUESTION_CATEGORY_RES:
+        if pattern.search(normalized):
             return category
     return None
 
@@ -254,7 +280,14 @@ def _is_generic_strategy_prompt(prompt: str) -> bool:
     text = (prompt or "").strip().lower()
     if not text:
         return False
-    return any(re.search(pattern, text) for pattern in _GENERIC_REQUEST_PATTERNS)
+    return _GENERIC_REQUEST_RE.search(text) is not None
+
+
+def _is_bare_generic_strategy_prompt(prompt: str) -> bool:
+    if not _is_generic_strategy_prompt(prompt):
+        return False
+    compact = _NON_WORD_RE.sub("", prompt.strip().lower())
+    return _BARE_GENERIC_REQUEST_RE.fullmatch(compact) is not None
 
 
 def _looks_like_code_generation_request(prompt: str) -> bool:
@@ -330,21 +363,17 @@ def _sanitize_intake_response(
             "risk": {},
         }
 
-    missing_fields = _unique_preserve_order(_to_str_list(payload.get("missing_fields")))
-    unsupported = _unique_preserve_order(_to_str_list(payload.get("unsupported_requirements")))
+    missing_fields = _unique_str_list(payload.get("missing_fields"))
+    unsupported = _unique_str_list(payload.get("unsupported_requirements"))
     clarification_questions = _to_str_list(payload.get("clarification_questions"))
-    assumptions = _unique_preserve_order(_to_str_list(payload.get("assumptions")))
-    development_requirements = _unique_preserve_order(_to_str_list(payload.get("development_requirements")))
+    assumptions = _unique_str_list(payload.get("assumptions"))
+    development_requirements = _unique_str_list(payload.get("development_requirements"))
 
     conversation_text = " ".join(
-        [prompt] + [str(m.content or "") for m in messages]
+        itertools.chain((prompt,), (m.content or "" for m in messages))
     ).lower()
-    for note in detect_unsupported_requirements(conversation_text):
-        if note not in unsupported:
-            unsupported.append(note)
-    for line in build_development_requirements(conversation_text):
-        if line not in development_requirements:
-            development_requirements.append(line)
+    _extend_unique(unsupported, detect_unsupported_requirements(conversation_text))
+    _extend_unique(development_requirements, build_development_requirements(conversation_text))
 
     if intent == "STRATEGY_CREATE" and _is_generic_strategy_prompt(prompt) and not assumptions:
         if not normalized_spec.get("entry_logic") and "entry_logic" not in missing_fields:
@@ -375,9 +404,7 @@ def _sanitize_intake_response(
         else:
             user_message = "요청이 명확하여 전략 생성을 진행할 수 있습니다."
     if status == "UNSUPPORTED_CAPABILITY":
-        for line in capability_summary_lines():
-            if line not in assumptions:
-                assumptions.append(line)
+        _extend_unique(assumptions, capability_summary_lines())
 
     return IntakeResponse(
         intent=intent,
@@ -594,15 +621,16 @@ def _latest_user_message(prompt: str, messages: list[ChatMessage]) -> str:
 # Main streaming generation pipeline
 # ---------------------------------------------------------------------------
 
-async def _generate_stream_body(body: StrategyRequest):
+async def _generate_stream_events(body: StrategyRequest) -> AsyncIterator[dict[str, Any]]:
+    """Yield generation events as dicts; the API layer serializes them to SSE once."""
     prompt = (body.user_prompt or "").strip()
     messages = body.messages or []
     if not messages and not prompt:
-        yield f"data: {json.dumps({'error': 'user_prompt must be non-empty'})}\n\n"
+        yield {"error": "user_prompt must be non-empty"}
         return
     config = get_config()
     if not config.is_azure_configured():
-        yield f"data: {json.dumps({'error': 'Azure OpenAI not configured'})}\n\n"
+        yield {"error": "Azure OpenAI not configured"}
         return
 
     prompt_text = _user_prompt_text(prompt, messages)
@@ -622,7 +650,7 @@ async def _generate_stream_body(body: StrategyRequest):
         )
 
     # Phase 1: Planning — Planner agent analyzes requirements and produces a structured spec
-    yield f"data: {json.dumps({'phase': 'planning'})}\n\n"
+    yield {"phase": "planning"}
 
     plan_spec: dict[str, Any] | None = body.confirmed_plan
     plan_confirmed = plan_spec is not None
@@ -638,7 +666,7 @@ async def _generate_stream_body(body: StrategyRequest):
             import asyncio as _asyncio
 
             async def _planner_task():
-                return chat_completion(
+                return await chat_completion_async(
                     config,
                     system_content=build_planner_system_prompt(),
                     user_content=planner_input,
@@ -651,7 +679,7 @@ async def _generate_stream_body(body: StrategyRequest):
             while not planner_future.done():
                 await _asyncio.sleep(10)
                 if not planner_future.done():
-                    yield f"data: {json.dumps({'heartbeat': True})}\n\n"
+                    yield {"heartbeat": True}
             plan_content, _ = planner_future.result()
             plan_spec = _extract_json_object(plan_content)
             if plan_spec:
@@ -662,7 +690,7 @@ async def _generate_stream_body(body: StrategyRequest):
     # Gatekeeping: if planner says request is NOT trading-related, reject early
     if plan_spec and plan_spec.get("is_trading_related") is False:
         logger.info("Non-trading request rejected by planner")
-        yield f"data: {json.dumps({'done': True, 'rejected': True, 'code': _NON_TRADING_REJECTION_MSG, 'repaired': False, 'repair_attempts': 0})}\n\n"
+        yield {"done": True, "rejected": True, "code": _NON_TRADING_REJECTION_MSG, "repaired": False, "repair_attempts": 0}
         return
 
     # Determine intent — trust the planner's classification.
@@ -684,13 +712,13 @@ async def _generate_stream_body(body: StrategyRequest):
             logger.info("Planner failed or returned no spec — routing to chat as fallback")
         else:
             logger.info("Planner classified request as %s — routing to chat", effective_intent)
-        yield f"data: {json.dumps({'intent': effective_intent})}\n\n"
+        yield {"intent": effective_intent}
         return
 
     # Unknown intent safety net — route to chat rather than generating code
     if intent != "modify":
         logger.warning("Unknown planner intent %r — routing to chat", intent)
-        yield f"data: {json.dumps({'intent': 'question'})}\n\n"
+        yield {"intent": "question"}
         return
 
     # Plan preview: if planner produced a "modify" plan and user hasn't confirmed yet,
@@ -698,7 +726,7 @@ async def _generate_stream_body(body: StrategyRequest):
     if not plan_confirmed:
         preview_text = _build_plan_preview_text(plan_spec)
         logger.info("Emitting plan preview for user confirmation: %s", plan_spec.get("strategy_name", "?"))
-        yield f"data: {json.dumps({'plan_preview': preview_text, 'plan_spec': plan_spec})}\n\n"
+        yield {"plan_preview": preview_text, "plan_spec": plan_spec}
         return
 
     # -----------------------------------------------------------------------
@@ -722,14 +750,14 @@ async def _generate_stream_body(body: StrategyRequest):
             messages=agent_messages,
             confirmed_plan=plan_spec,
         ):
-            yield f"data: {json.dumps(event)}\n\n"
+            yield event
             if event.get("done") or event.get("error"):
                 return
-        yield f"data: {json.dumps({'error': 'Agent generation ended without completion. Legacy fallback is disabled for code generation.'})}\n\n"
+        yield {"error": "Agent generation ended without completion. Legacy fallback is disabled for code generation."}
         return
     except Exception as e:
         logger.exception("Agent generation failed: %s", e)
-        yield f"data: {json.dumps({'error': 'Agent generation failed. Legacy fallback is disabled for code generation.'})}\n\n"
+        yield {"error": "Agent generation failed. Legacy fallback is disabled for code generation."}
         return
 
     # -----------------------------------------------------------------------
@@ -759,17 +787,15 @@ async def _generate_stream_body(body: StrategyRequest):
 
         dsl_code = ensure_ohlcv_bindings(dsl_code)
 
-        yield f"data: {json.dumps({'phase': 'generating', 'progress': 0})}\n\n"
-        chunk_size = 80
-        for i in range(0, len(dsl_code), chunk_size):
-            chunk = dsl_code[i : i + chunk_size]
-            yield f"data: {json.dumps({'token': chunk})}\n\n"
-        yield f"data: {json.dumps({'phase': 'verifying'})}\n\n"
-        yield f"data: {json.dumps({'done': True, 'code': dsl_code, 'repaired': False, 'repair_attempts': 0})}\n\n"
+        yield {"phase": "generating", "progress": 0}
+        for i in range(0, len(dsl_code), _CODE_FRAME_CHARS):
+            yield {"token": dsl_code[i : i + _CODE_FRAME_CHARS]}
+        yield {"phase": "verifying"}
+        yield {"done": True, "code": dsl_code, "repaired": False, "repair_attempts": 0}
         return
 
     # Phase 2: Generating — Coder agent writes the code (streaming)
-    yield f"data: {json.dumps({'phase': 'generating', 'progress': 0})}\n\n"
+    yield {"phase": "generating", "progress": 0}
 
     try:
         system_content = build_system_prompt(user_prompt=prompt_text)
@@ -779,7 +805,9 @@ async def _generate_stream_body(body: StrategyRequest):
 
         coder_model = config.resolved_coder_model
         code_acc: list[str] = []
-        token_count = 0
+        # 스트림 델타는 여러 토큰이 묶여 오므로 진행률은 문자 수(≈4자/토큰)로 추정한다.
+        char_count = 0
+        next_progress_chars = 200
         if messages:
             openai_messages = [{"role": m.role, "content": m.content} for m in messages]
             async for token in chat_completion_stream(
@@ -790,10 +818,11 @@ async def _generate_stream_body(body: StrategyRequest):
                 enable_continuation=True,
             ):
                 code_acc.append(token)
-                token_count += 1
-                yield f"data: {json.dumps({'token': token})}\n\n"
-                if token_count % 50 == 0:
-                    yield f"data: {json.dumps({'phase': 'generating', 'progress': min(90, token_count // 8)})}\n\n"
+                char_count += len(token)
+                yield {"token": token}
+                if char_count >= next_progress_chars:
+                    next_progress_chars = char_count + 200
+                    yield {"phase": "generating", "progress": min(90, char_count // 32)}
         else:
             async for token in chat_completion_stream(
                 config,
@@ -803,25 +832,26 @@ async def _generate_stream_body(body: StrategyRequest):
                 enable_continuation=True,
             ):
                 code_acc.append(token)
-                token_count += 1
-                yield f"data: {json.dumps({'token': token})}\n\n"
-                if token_count % 50 == 0:
-                    yield f"data: {json.dumps({'phase': 'generating', 'progress': min(90, token_count // 8)})}\n\n"
+                char_count += len(token)
+                yield {"token": token}
+                if char_count >= next_progress_chars:
+                    next_progress_chars = char_count + 200
+                    yield {"phase": "generating", "progress": min(90, char_count // 32)}
 
         raw_code = "".join(code_acc)
 
         if _is_model_refusal(raw_code):
             logger.info("Model self-refusal detected in code generation stream")
-            yield f"data: {json.dumps({'done': True, 'rejected': True, 'code': _NON_TRADING_REJECTION_MSG, 'repaired': False, 'repair_attempts': 0})}\n\n"
+            yield {"done": True, "rejected": True, "code": _NON_TRADING_REJECTION_MSG, "repaired": False, "repair_attempts": 0}
             return
 
         code = _sanitize_code_quotes(_extract_python_code(raw_code))
         if not code:
-            yield f"data: {json.dumps({'error': 'Empty code from stream'})}\n\n"
+            yield {"error": "Empty code from stream"}
             return
 
         # Phase 3: Verifying
-        yield f"data: {json.dumps({'phase': 'verifying'})}\n\n"
+        yield {"phase": "verifying"}
         verification_error = _verify_strategy_code(code)
 
         repaired = False
@@ -831,7 +861,7 @@ async def _generate_stream_body(body: StrategyRequest):
             if verification_error is None:
                 break
             repair_attempts = attempt + 1
-            yield f"data: {json.dumps({'phase': 'repairing', 'attempt': repair_attempts, 'max_attempts': _MAX_REPAIR_ATTEMPTS})}\n\n"
+            yield {"phase": "repairing", "attempt": repair_attempts, "max_attempts": _MAX_REPAIR_ATTEMPTS}
 
             logger.info(
                 "Stream strategy verification failed (attempt %d/%d): %s",
@@ -851,7 +881,7 @@ async def _generate_stream_body(body: StrategyRequest):
                 import asyncio as _asyncio
 
                 async def _repair_task():
-                    return chat_completion(
+                    return await chat_completion_async(
                         config,
                         system_content=build_repair_system_prompt(),
                         user_content="\n".join(repair_parts),
@@ -862,7 +892,7 @@ async def _generate_stream_body(body: StrategyRequest):
                 while not repair_future.done():
                     await _asyncio.sleep(10)
                     if not repair_future.done():
-                        yield f"data: {json.dumps({'heartbeat': True})}\n\n"
+                        yield {"heartbeat": True}
                 repaired_content, _ = repair_future.result()
                 if repaired_content and repaired_content.strip():
                     candidate = _sanitize_code_quotes(_extract_python_code(repaired_content))
@@ -881,7 +911,7 @@ async def _generate_stream_body(body: StrategyRequest):
 
         code = ensure_ohlcv_bindings(code)
 
-        yield f"data: {json.dumps({'done': True, 'code': code, 'repaired': repaired, 'repair_attempts': repair_attempts})}\n\n"
+        yield {"done": True, "code": code, "repaired": repaired, "repair_attempts": repair_attempts}
     except Exception as e:
         logger.exception("LLM stream failed at generate/stream: %s", e)
-        yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        yield {"error": str(e)}
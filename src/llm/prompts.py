@@ -2,6 +2,7 @@
 
 import ast
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -152,20 +153,35 @@ Reference: `scripts/strategies/rsi_long_short_strategy.py`.
 """
 
 
+# Static chat prompt fragments — built once at import instead of per request.
+_BACKTEST_ANALYSIS_INSTRUCTION = (
+    "\n\nWhen the user provides backtest results (e.g., return%, win rate, max drawdown, "
+    "Sharpe ratio, trade counts), you MUST:\n"
+    "1. Analyze the key metrics and identify strengths and weaknesses\n"
+    "2. Explain why the strategy may be underperforming (if applicable)\n"
+    "3. Suggest specific parameter changes or logic improvements with rationale\n"
+    "4. Focus on actionable advice: concrete numbers for parameter changes, specific conditions to add/modify\n"
+    "Respond in the same language as the user's message.\n\n"
+    "IMPORTANT: This chat path must NEVER generate full strategy code, even if the user explicitly asks for code. "
+    "Instead, tell the user that code generation must use the strategy generation workflow. "
+    "When suggesting improvements, describe the changes in natural language with concrete parameter values "
+    "and logic descriptions, but do NOT produce Python, PineScript, or any full code block."
+)
+
+_GENERAL_CHAT_SYSTEM_PROMPT = (
+    "You are a trading strategy expert assistant. "
+    "Answer the user's question about trading strategies, markets, indicators, and technical analysis. "
+    "Respond in the same language as the user's message. "
+    "Provide clear, informative answers. NEVER generate full strategy code in this chat path; "
+    "tell users to use the strategy generation workflow for code creation.\n\n"
+    "When web search is available, use it to look up real-time market data, recent news, "
+    "macro-economic events (FOMC, CPI, etc.), and current market conditions to ground your analysis. "
+    "Always cite sources when referencing search results."
+    + _BACKTEST_ANALYSIS_INSTRUCTION
+)
+
+
 def build_strategy_chat_system_prompt(code: str, summary: str | None) -> str:
-    backtest_analysis_instruction = (
-        "\n\nWhen the user provides backtest results (e.g., return%, win rate, max drawdown, "
-        "Sharpe ratio, trade counts), you MUST:\n"
-        "1. Analyze the key metrics and identify strengths and weaknesses\n"
-        "2. Explain why the strategy may be underperforming (if applicable)\n"
-        "3. Suggest specific parameter changes or logic improvements with rationale\n"
-        "4. Focus on actionable advice: concrete numbers for parameter changes, specific conditions to add/modify\n"
-        "Respond in the same language as the user's message.\n\n"
-        "IMPORTANT: This chat path must NEVER generate full strategy code, even if the user explicitly asks for code. "
-        "Instead, tell the user that code generation must use the strategy generation workflow. "
-        "When suggesting improvements, describe the changes in natural language with concrete parameter values "
-        "and logic descriptions, but do NOT produce Python, PineScript, or any full code block."
-    )
     if code and code.strip():
         # Extract on_bar method body for compactness; fall back to full code
         on_bar_src = _extract_on_bar(code)
@@ -178,23 +194,18 @@ def build_strategy_chat_system_prompt(code: str, summary: str | None) -> str:
             f"{_CHAT_INTERFACE_REFERENCE}\n\n"
             f"{code_section}\n\n"
             f"Summary:\n{summary or 'N/A'}"
-            f"{backtest_analysis_instruction}"
+            f"{_BACKTEST_ANALYSIS_INSTRUCTION}"
         )
-    return (
-        "You are a trading strategy expert assistant. "
-        "Answer the user's question about trading strategies, markets, indicators, and technical analysis. "
-        "Respond in the same language as the user's message. "
-        "Provide clear, informative answers. NEVER generate full strategy code in this chat path; "
-        "tell users to use the strategy generation workflow for code creation.\n\n"
-        "When web search is available, use it to look up real-time market data, recent news, "
-        "macro-economic events (FOMC, CPI, etc.), and current market conditions to ground your analysis. "
-        "Always cite sources when referencing search results."
-        + backtest_analysis_instruction
-    )
+    return _GENERAL_CHAT_SYSTEM_PROMPT
 
 
+@lru_cache(maxsize=32)
 def _extract_on_bar(code: str) -> str | None:
-    """Extract the on_bar method source from strategy code using AST."""
+    """Extract the on_bar method source from strategy code using AST.
+
+    Cached because every turn of a strategy chat session re-sends the same code,
+    and parsing a full strategy file costs milliseconds on the event loop.
+    """
     try:
         tree = ast.parse(code)
     except SyntaxError:
@@ -232,6 +243,40 @@ def _read_file(path: Path) -> str | None:
     return None
 
 
+# Strategy examples are re-selected per request from the prompt text; the
+# directory listing and file contents are cached and revalidated by mtime so
+# each request costs a few stat() calls instead of a glob plus file reads.
+_strategy_listing: tuple[float, tuple[Path, ...]] | None = None
+_example_texts: dict[Path, tuple[float, str]] = {}
+
+
+def _list_strategy_examples() -> tuple[Path, ...]:
+    global _strategy_listing  # noqa: PLW0603
+    try:
+        mtime = _STRATEGIES_DIR.stat().st_mtime
+    except OSError:
+        return ()
+    cached = _strategy_listing
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    paths = tuple(sorted(_STRATEGIES_DIR.glob("*_strategy.py")))
+    _strategy_listing = (mtime, paths)
+    return paths
+
+
+def _read_example(path: Path) -> str | None:
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    cached = _example_texts.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    text = path.read_text(encoding="utf-8")
+    _example_texts[path] = (mtime, text)
+    return text
+
+
 def _load_template_and_skill() -> tuple[str | None, str | None]:
     return _read_file(_TEMPLATE_PATH), _read_file(_SKILL_PATH)
 
@@ -255,10 +300,7 @@ def _load_interface_docs() -> str:
 
 
 def _select_example_strategies(user_prompt: str, max_examples: int = 3) -> list[Path]:
-    if not _STRATEGIES_DIR.is_dir():
-        return [p for p in _DEFAULT_EXAMPLES if p.exists()]
-
-    all_strategies = sorted(_STRATEGIES_DIR.glob("*_strategy.py"))
+    all_strategies = _list_strategy_examples()
     if not all_strategies:
         return [p for p in _DEFAULT_EXAMPLES if p.exists()]
 
@@ -302,7 +344,7 @@ def _load_example_strategies(user_prompt: str = "") -> str:
     )
     parts: list[str] = []
     for path in paths:
-        content = _read_file(path)
+        content = _read_example(path)
         if content:
             parts.append(f"### {path.name}\n\n{content}")
     return "\n\n".join(parts)
@@ -525,7 +567,7 @@ def build_system_prompt(user_prompt: str = "") -> str:
         for path in extra_paths:
             if path in _DEFAULT_EXAMPLES:
                 continue  # already in static prompt
-            content = _read_file(path)
+            content = _read_example(path)
             if content:
                 extra_parts.append(f"### {path.name}\n\n{content}")
         if extra_parts:
@@ -541,12 +583,17 @@ def build_planner_system_prompt() -> str:
     return PLANNER_SYSTEM_PROMPT
 
 
+_cached_repair_system_prompt: str | None = None
+
+
 def build_repair_system_prompt() -> str:
+    global _cached_repair_system_prompt  # noqa: PLW0603
+    if _cached_repair_system_prompt is not None:
+        return _cached_repair_system_prompt
     static = _build_static_system_prompt()
     verify_skill = _load_verify_skill()
-    if verify_skill:
-        return static + "\n\n" + verify_skill
-    return static
+    _cached_repair_system_prompt = static + "\n\n" + verify_skill if verify_skill else static
+    return _cached_repair_system_prompt
 
 
 ANALYST_SYSTEM_PROMPT = """You are a quantitative trading strategy analyst.
@@ -637,6 +684,9 @@ Use exactly one of: "진입 (Entry)", "청산 (Exit)", "지표 (Indicator)", "
 """
 
 
+_cached_agent_base_prompt: str | None = None
+
+
 def build_agent_system_prompt(user_prompt: str = "") -> str:
     """Build the system prompt for agent-based generation.
 
@@ -644,8 +694,12 @@ def build_agent_system_prompt(user_prompt: str = "") -> str:
     that the pipeline prompt uses, so the agent starts with full knowledge
     and only needs to read REFERENCE STRATEGIES via tools.
     """
-    static = _build_static_system_prompt()
-    prompt = AGENT_SYSTEM_PROMPT.replace("{static_context}", static)
+    global _cached_agent_base_prompt  # noqa: PLW0603
+    if _cached_agent_base_prompt is None:
+        _cached_agent_base_prompt = AGENT_SYSTEM_PROMPT.replace(
+            "{static_context}", _build_static_system_prompt()
+        )
+    prompt = _cached_agent_base_prompt
 
     # Append user-prompt-relevant examples hint
     if user_prompt:
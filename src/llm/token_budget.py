@@ -45,6 +45,14 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
     return len(enc.encode(text))
 
 
+@lru_cache(maxsize=32)
+def _count_system_tokens(system_prompt: str, model: str) -> int:
+    # System prompts are a handful of large, mostly static strings (the
+    # generation prompt alone is ~15KB), so their token counts are memoized
+    # instead of re-encoding them on every multi-turn call.
+    return count_tokens(system_prompt, model)
+
+
 def get_context_window(model: str) -> int:
     for prefix, size in _MODEL_CONTEXT_WINDOWS.items():
         if model.startswith(prefix):
@@ -69,7 +77,7 @@ def fit_messages(
     """
     context_window = get_context_window(model)
     safety_margin = 1024
-    system_tokens = count_tokens(system_prompt, model)
+    system_tokens = _count_system_tokens(system_prompt, model)
     budget = context_window - system_tokens - max_output_tokens - safety_margin
 
     if budget <= 0:
@@ -102,14 +110,17 @@ def fit_messages(
             compressed[i] = {"role": "assistant", "content": _CODE_PLACEHOLDER}
 
     # Phase 2: Check total token count
-    total = sum(count_tokens(m.get("content", ""), model) for m in compressed)
+    token_counts = [count_tokens(m.get("content", ""), model) for m in compressed]
+    total = sum(token_counts)
     if total <= budget:
         return compressed
 
     # Phase 3: Drop oldest messages (but always keep the last message)
-    while len(compressed) > 1 and total > budget:
-        dropped = compressed.pop(0)
-        total -= count_tokens(dropped.get("content", ""), model)
+    drop = 0
+    while drop < len(compressed) - 1 and total > budget:
+        total -= token_counts[drop]
+        drop += 1
+    compressed = compressed[drop:]
 
     if total > budget:
         logger.warning(
@@ -9,7 +9,13 @@ from pathlib import Path
 from typing import Any
 
 from backtest.context import BacktestContext
-from backtest.data_fetcher import fetch_all_klines
+from backtest.data_fetcher import (
+    KlineColumns,
+    fetch_all_klines,
+    get_market_data_client,
+    klines_to_columns,
+    klines_to_frame,
+)
 from backtest.engine import BacktestEngine
 from backtest.risk import BacktestRiskManager
 from binance.client import BinanceHTTPClient
@@ -25,9 +31,11 @@ from settings import get_settings
 # a fixed historical window (deterministic by start/end ts) lets later runs in a
 # sweep reuse the data instead of re-hitting the API. Bounded by entry count and
 # a short TTL so a long-lived runner process does not retain large lists forever.
+# Entries are stored as columnar ``KlineColumns`` (converted once after the fetch)
+# so the engine and chart builder never re-parse Binance's string rows.
 _KLINES_CACHE_MAX_ENTRIES = 3
 _KLINES_CACHE_TTL_SEC = 900.0
-_klines_cache: OrderedDict[tuple[str, str, str, int, int], tuple[float, list[list[Any]]]] = (
+_klines_cache: OrderedDict[tuple[str, str, str, int, int], tuple[float, KlineColumns]] = (
     OrderedDict()
 )
 _klines_cache_lock = asyncio.Lock()
@@ -42,7 +50,7 @@ async def _fetch_klines_cached(  # noqa: PLR0913
     start_ts: int,
     end_ts: int,
     progress_callback: Any,
-) -> list[list[Any]]:
+) -> KlineColumns:
     key = (base_url, symbol, interval, int(start_ts), int(end_ts))
     now = time.monotonic()
     async with _klines_cache_lock:
@@ -56,13 +64,15 @@ async def _fetch_klines_cached(  # noqa: PLR0913
                 return data
             del _klines_cache[key]
 
-    klines = await fetch_all_klines(
-        client=client,
-        symbol=symbol,
-        interval=interval,
-        start_ts=start_ts,
-        end_ts=end_ts,
-        progress_callback=progress_callback,
+    klines = klines_to_columns(
+        await fetch_all_klines(
+            client=client,
+            symbol=symbol,
+            interval=interval,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            progress_callback=progress_callback,
+        )
     )
 
     async with _klines_cache_lock:
@@ -73,6 +83,23 @@ async def _fetch_klines_cached(  # noqa: PLR0913
     return klines
 
 
+# Chart candle records for the most recent kline window. Sweep children share
+# one cached ``KlineColumns`` object (see ``_fetch_klines_cached``), so the
+# per-candle dict list is built once per window and reused instead of being
+# rebuilt for every run. Candle dicts are never mutated downstream (they are
+# only serialized into result_json).
+_chart_candles_memo: tuple[KlineColumns, list[dict[str, Any]]] | None = None
+
+
+def _chart_candles(klines: KlineColumns) -> list[dict[str, Any]]:
+    global _chart_candles_memo
+    if _chart_candles_memo is not None and _chart_candles_memo[0] is klines:
+        return _chart_candles_memo[1]
+    candles: list[dict[str, Any]] = klines_to_frame(klines).to_dict("records")
+    _chart_candles_memo = (klines, candles)
+    return candles
+
+
 def _json_safe(value: Any) -> Any:
     if value is None or isinstance(value, (str, bool, int, float)):
         return value
@@ -137,22 +164,10 @@ def _collect_backtest_chart_data(
     interval: str,
     leverage: int,
     commission: float,
-    klines: list[list[Any]],
+    klines: KlineColumns,
     risk_manager: BacktestRiskManager,
 ) -> dict[str, Any]:
-    candles: list[dict[str, Any]] = []
-    for kline in klines:
-        candles.append(
-            {
-                "open_time": int(kline[0]),
-                "close_time": int(kline[6]),
-                "open": float(kline[1]),
-                "high": float(kline[2]),
-                "low": float(kline[3]),
-                "close": float(kline[4]),
-                "volume": float(kline[5]),
-            }
-        )
+    candles = _chart_candles(klines)
 
     raw_indicator_config = getattr(strategy, "indicator_config", {})
     indicator_config = _json_safe(raw_indicator_config) if isinstance(raw_indicator_config, dict) else {}
@@ -226,15 +241,23 @@ def _collect_backtest_chart_data(
             values.extend([None] * (index + 1 - len(values)))
         values[index] = value
 
-    for i, candle in enumerate(candles):
+    bars = zip(
+        klines.open.tolist(),
+        klines.high.tolist(),
+        klines.low.tolist(),
+        klines.close.tolist(),
+        klines.volume.tolist(),
+        klines.close_time.tolist(),
+    )
+    for i, (open_price, high_price, low_price, close_price, volume, close_time) in enumerate(bars):
         analysis_ctx.update_bar(
-            open_price=float(candle["open"]),
-            high_price=float(candle["high"]),
-            low_price=float(candle["low"]),
-            close_price=float(candle["close"]),
-            volume=float(candle["volume"]),
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            volume=volume,
         )
-        analysis_ctx.update_price(float(candle["close"]), timestamp=int(candle["close_time"]))
+        analysis_ctx.update_price(close_price, timestamp=close_time)
 
         for call in indicator_calls:
             indicator_name = str(call["indicator"])
@@ -316,12 +339,7 @@ async def run_backtest(
 
     settings = get_settings()
     backtest_url = settings.binance.base_url_backtest or "https://fapi.binance.com"
-    client = BinanceHTTPClient(
-        api_key="",
-        api_secret="",
-        base_url=backtest_url,
-        timeout=60.0,
-    )
+    client = get_market_data_client(backtest_url, timeout=60.0)
 
     try:
         klines = await _fetch_klines_cached(
@@ -336,7 +354,7 @@ async def run_backtest(
         if should_stop.is_set():
             return {"stopped": True}
 
-        if not klines:
+        if klines.size == 0:
             raise ValueError("No klines returned for backtest")
 
         risk_config = RiskConfig(
@@ -402,4 +420,3 @@ async def run_backtest(
     finally:
         if "cleanup_strategy_file" in locals() and cleanup_strategy_file:
             strategy_file.unlink(missing_ok=True)
-        await client.aclose()
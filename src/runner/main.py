@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
+from backtest.data_fetcher import close_market_data_clients
 from control.alembic_upgrade import run_alembic_upgrade_head
 from control.db import create_async_engine, create_session_maker, init_db
 from runner.worker import RunnerWorker
@@ -42,7 +43,10 @@ async def _amain() -> None:
         f"[runner] starting worker role={role} (user-specific Binance keys mode, "
         f"live_concurrency={settings.runner_live_concurrency})"
     )
-    await worker.run_forever()
+    try:
+        await worker.run_forever()
+    finally:
+        await close_market_data_clients()
 
 
 def main() -> None:
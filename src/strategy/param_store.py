@@ -134,9 +134,9 @@ def _blob_container_client(container: str) -> Any | None:
     managed identity)을 그대로 재사용하되 대상 컨테이너만 바꾼다.
     """
     try:
-        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
         from azure.storage.blob import ContainerClient
 
+        from common.blob_storage import default_blob_credential
         from settings import get_settings
     except Exception:  # noqa: BLE001
         return None
@@ -148,15 +148,8 @@ def _blob_container_client(container: str) -> Any | None:
         if conn_str:
             return ContainerClient.from_connection_string(conn_str, container)
         if account_url:
-            client_id = os.getenv("AZURE_CLIENT_ID", "").strip()
-            if os.getenv("IDENTITY_ENDPOINT"):
-                kwargs: dict[str, Any] = {"client_id": client_id} if client_id else {}
-                credential: Any = ManagedIdentityCredential(**kwargs)
-            else:
-                kwargs = {"managed_identity_client_id": client_id} if client_id else {}
-                credential = DefaultAzureCredential(**kwargs)
             return ContainerClient(account_url=account_url, container_name=container,
-                                   credential=credential)
+                                   credential=default_blob_credential())
     except Exception:  # noqa: BLE001
         logger.debug("param_store: blob container client init failed", exc_info=True)
     return None
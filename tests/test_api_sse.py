@@ -0,0 +1,12 @@
+"""Unit tests for the SSE frame encoding used by the LLM streaming endpoints."""
+
+from __future__ import annotations
+
+from api import main as api_main
+
+
+def test_sse_data_encodes_compact_utf8_frame() -> None:
+    frame = api_main._sse_data({"token": "매수", "done": False})
+
+    assert isinstance(frame, bytes)
+    assert frame == 'data: {"token":"매수","done":false}\n\n'.encode()
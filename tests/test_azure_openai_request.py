@@ -0,0 +1,113 @@
+"""Unit tests for Responses API request construction."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+import llm.azure_openai as azure_openai
+from llm.azure_openai import _build_response_kwargs
+from llm.config import RelayConfig
+from llm.prompts import build_repair_system_prompt, build_system_prompt
+
+
+def _config() -> RelayConfig:
+    return RelayConfig(openai_base_url="https://example.invalid/openai/v1", openai_model="test-model")
+
+
+def test_generate_and_repair_prompts_share_prompt_cache_key():
+    config = _config()
+
+    generate = _build_response_kwargs(config, build_system_prompt("RSI 과매도 반등 전략"), "spec")
+    repair = _build_response_kwargs(config, build_repair_system_prompt(), "code")
+    intake = _build_response_kwargs(config, "You are an intake assistant.", "prompt")
+
+    assert generate["prompt_cache_key"] == repair["prompt_cache_key"]
+    assert intake["prompt_cache_key"] != generate["prompt_cache_key"]
+
+
+def test_empty_system_prompt_is_omitted():
+    kwargs = _build_response_kwargs(_config(), "", "Hello")
+
+    assert "instructions" not in kwargs
+    assert "prompt_cache_key" not in kwargs
+
+
+class _Delta:
+    type = "response.output_text.delta"
+
+    def __init__(self, delta: str) -> None:
+        self.delta = delta
+
+
+def _fake_stream_client(script):
+    """Fake Responses client whose stream yields deltas, sleeping on float entries."""
+
+    async def _events():
+        for item in script:
+            if isinstance(item, float):
+                await asyncio.sleep(item)
+            else:
+                yield _Delta(item)
+
+    class _Responses:
+        async def create(self, **kwargs):
+            return _events()
+
+    class _Client:
+        responses = _Responses()
+
+    @asynccontextmanager
+    async def _create(config, timeout=None):
+        yield _Client()
+
+    return _create
+
+
+@pytest.mark.asyncio
+async def test_stream_flushes_buffered_text_while_model_pauses(monkeypatch):
+    monkeypatch.setattr(
+        azure_openai, "_create_async_client", _fake_stream_client(["a", "b", 0.3, "c"])
+    )
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    chunks: list[tuple[str, float]] = []
+
+    async for chunk in azure_openai.chat_completion_stream(_config(), "system", "user"):
+        chunks.append((chunk, loop.time() - start))
+
+    assert "".join(c for c, _ in chunks) == "abc"
+    assert chunks[0][0] == "a"
+    # "b" is flushed by the timer, not held back until "c" arrives after the pause.
+    b_at = next(t for c, t in chunks if "b" in c)
+    assert b_at < 0.2
+
+
+def test_async_credentials_from_previous_loop_are_closed():
+    config = _config()
+
+    async def _get():
+        return azure_openai._get_async_client(config)
+
+    first = asyncio.run(_get())
+    (credential,) = azure_openai._async_credentials.values()
+    closed: list[bool] = []
+    original_close = credential.close
+
+    async def _tracking_close():
+        closed.append(True)
+        await original_close()
+
+    credential.close = _tracking_close
+
+    async def _get_and_shutdown():
+        client = await _get()
+        await azure_openai.close_clients()
+        return client
+
+    second = asyncio.run(_get_and_shutdown())
+
+    assert second is not first
+    assert closed == [True]
@@ -0,0 +1,40 @@
+"""Unit tests for keyword-based unsupported capability detection."""
+
+from __future__ import annotations
+
+from llm.capability_registry import (
+    build_development_requirements,
+    detect_unsupported_categories,
+    detect_unsupported_requirements,
+)
+
+
+def test_detectors_keep_rule_order_and_dedupe():
+    text = "Use FOMC news and tweet sentiment; call ctx.get_news() and fetch_tweet()."
+
+    assert detect_unsupported_categories(text) == [
+        "social_stream",
+        "news_feed",
+        "sentiment_engine",
+        "macro_feed",
+    ]
+    found = detect_unsupported_requirements(text)
+    assert len(found) == len(set(found))
+    assert found[-2:] == [
+        "StrategyContext에는 get_news()가 없습니다.",
+        "전략 코드에서 외부 트윗 API 직접 호출은 현재 지원하지 않습니다.",
+    ]
+    lines = build_development_requirements(text)
+    assert lines[0].startswith("[소셜 스트림] ")
+    assert [line for line in lines if line.startswith("[런타임 확장]")] == [
+        "[런타임 확장] 뉴스 데이터 저장소와 ctx.get_indicator(...) 브리지 구현이 필요합니다.",
+        "[런타임 확장] 전략 코드 내부 직접 API 호출 대신 외부 수집 파이프라인 + 인디케이터 주입 구조가 필요합니다.",
+    ]
+
+
+def test_detectors_ignore_plain_ta_requests():
+    text = "RSI 30 이하에서 매수, 70 이상에서 청산"
+
+    assert detect_unsupported_categories(text) == []
+    assert detect_unsupported_requirements(text) == []
+    assert build_development_requirements("") == []
@@ -0,0 +1,126 @@
+"""Unit tests for backtest kline collection and conversion."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backtest import data_fetcher
+from backtest.data_fetcher import fetch_all_klines, klines_to_columns, klines_to_frame
+
+_MINUTE_MS = 60_000
+
+
+def _kline(open_time: int) -> list:
+    return [open_time, "1.0", "2.0", "0.5", "1.5", "10", open_time + _MINUTE_MS - 1]
+
+
+class _FakeClient:
+    """Serves 1m klines over a fixed range, honouring start/end/limit like Binance."""
+
+    def __init__(self, first_ts: int, count: int) -> None:
+        self._klines = [_kline(first_ts + i * _MINUTE_MS) for i in range(count)]
+        self.calls = 0
+
+    async def fetch_klines(self, symbol, interval, start_ts=None, end_ts=None, limit=500):
+        self.calls += 1
+        rows = [k for k in self._klines if start_ts <= k[0] <= end_ts]
+        return rows[:limit]
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_klines_concurrent_windows_are_complete_and_ordered():
+    client = _FakeClient(first_ts=0, count=1000)
+    progress: list[float] = []
+
+    klines = await fetch_all_klines(
+        client,
+        "BTCUSDT",
+        "1m",
+        0,
+        1000 * _MINUTE_MS - 1,
+        batch_size=100,
+        progress_callback=progress.append,
+    )
+
+    assert [k[0] for k in klines] == [i * _MINUTE_MS for i in range(1000)]
+    assert client.calls == 10
+    assert progress[-1] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_klines_unknown_interval_falls_back_to_sequential():
+    client = _FakeClient(first_ts=0, count=250)
+
+    klines = await fetch_all_klines(client, "BTCUSDT", "1M", 0, 250 * _MINUTE_MS - 1, batch_size=100)
+
+    assert len(klines) == 250
+    assert len({k[0] for k in klines}) == 250
+
+
+def test_klines_to_frame_casts_columns():
+    frame = klines_to_frame([_kline(0), _kline(_MINUTE_MS)])
+
+    assert list(frame.columns) == [
+        "open_time", "close_time", "open", "high", "low", "close", "volume",
+    ]
+    assert str(frame["open_time"].dtype) == "int64"
+    assert str(frame["close"].dtype) == "float64"
+    assert frame["close"].tolist() == [1.5, 1.5]
+    assert klines_to_frame([]).empty
+
+
+def test_klines_to_columns_is_idempotent_and_sized():
+    columns = klines_to_columns([_kline(0), _kline(_MINUTE_MS), _kline(2 * _MINUTE_MS)])
+
+    assert columns.size == 3
+    assert klines_to_columns(columns) is columns
+    assert columns.open_time.tolist() == [0, _MINUTE_MS, 2 * _MINUTE_MS]
+    assert klines_to_columns([]).size == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_klines_concurrent_requests_are_paced_by_weight(monkeypatch):
+    monkeypatch.setattr(data_fetcher, "_KLINES_WEIGHT_BUDGET_PER_MINUTE", 2400)
+    client = _FakeClient(first_ts=0, count=500)
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+    fetch = client.fetch_klines
+
+    async def timed_fetch(*args, **kwargs):
+        starts.append(loop.time())
+        return await fetch(*args, **kwargs)
+
+    client.fetch_klines = timed_fetch
+    await fetch_all_klines(client, "BTCUSDT", "1m", 0, 500 * _MINUTE_MS - 1, batch_size=100)
+
+    # limit=100 -> weight 2 -> 2 * 60 / 2400 = 0.05s between request starts
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 5
+    assert min(gaps) >= 0.045
+
+
+def test_market_data_clients_from_previous_loop_are_closed():
+    async def _get():
+        return data_fetcher.get_market_data_client("https://example.invalid", timeout=5.0)
+
+    first = asyncio.run(_get())
+    closed: list[bool] = []
+    original_aclose = first.aclose
+
+    async def _tracking_aclose():
+        closed.append(True)
+        await original_aclose()
+
+    first.aclose = _tracking_aclose
+
+    async def _get_and_shutdown():
+        client = await _get()
+        await data_fetcher.close_market_data_clients()
+        return client
+
+    second = asyncio.run(_get_and_shutdown())
+
+    assert second is not first
+    assert closed == [True]
@@ -0,0 +1,34 @@
+"""Unit tests for intake response normalization."""
+
+from __future__ import annotations
+
+from llm.generate import _extract_json_object, _sanitize_intake_response
+
+
+def test_sanitize_intake_dedupes_and_merges_detected_notes():
+    payload = {
+        "intent": "strategy_create",
+        "status": "ready",
+        "missing_fields": ["exit_logic", " exit_logic ", ""],
+        "unsupported_requirements": ["외부 감성분석 파이프라인 연동이 필요합니다."],
+        "assumptions": ["a", "a", "b"],
+        "development_requirements": [],
+        "normalized_spec": {"symbol": "BTCUSDT", "entry_logic": "RSI < 30"},
+    }
+
+    result = _sanitize_intake_response(payload, prompt="뉴스 감성 기반 전략", messages=[])
+
+    assert result.status == "UNSUPPORTED_CAPABILITY"
+    assert result.missing_fields == ["exit_logic"]
+    assert result.unsupported_requirements[0] == "외부 감성분석 파이프라인 연동이 필요합니다."
+    assert len(result.unsupported_requirements) == len(set(result.unsupported_requirements))
+    assert result.assumptions[:2] == ["a", "b"]
+    assert len(result.assumptions) == len(set(result.assumptions))
+    assert result.development_requirements[0].startswith("[뉴스 피드] ")
+
+
+def test_extract_json_object_takes_first_object_despite_surrounding_prose():
+    assert _extract_json_object('```json\n{"status": "READY"}\n```') == {"status": "READY"}
+    assert _extract_json_object('Result: {"status": "READY"} (see {"note": 1})') == {"status": "READY"}
+    assert _extract_json_object("no json here") is None
+    assert _extract_json_object("{broken") is None
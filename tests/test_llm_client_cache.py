@@ -0,0 +1,85 @@
+"""Unit tests for LLMClient's exact-match response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+import llm.azure_openai as azure_openai
+import llm.client as llm_client
+from llm.config import get_config
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://example.invalid/openai/v1")
+    monkeypatch.setenv("OPENAI_MODEL", "test-model")
+    get_config.cache_clear()
+    llm_client._response_cache.clear()
+    yield llm_client.LLMClient()
+    get_config.cache_clear()
+    llm_client._response_cache.clear()
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded: list[str] = []
+
+    async def fake_completion(config, system_content, user_content, **kwargs):
+        recorded.append(user_content)
+        return '{"verdict": "ok"}', "test-model"
+
+    monkeypatch.setattr(azure_openai, "chat_completion_async", fake_completion)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_analyze_backtest_reuses_identical_request(client, calls):
+    first = await client.analyze_backtest("code", "results", "summary")
+    first["verdict"] = "mutated"
+    second = await client.analyze_backtest("code", "results", "summary")
+
+    assert second == {"verdict": "ok"}
+    assert len(calls) == 1
+
+    await client.analyze_backtest("code", "other results", "summary")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_bounded(client, calls, monkeypatch):
+    monkeypatch.setattr(llm_client, "_RESPONSE_CACHE_MAX_ENTRIES", 2)
+
+    for code in ("a", "b", "c"):
+        await client.summarize_strategy(code)
+    await client.summarize_strategy("a")
+
+    assert calls == ["a", "b", "c", "a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prompt", ["전략 만들어줘", "전략 생성해주세요!", "아무거나 전략 하나 만들어줘"])
+async def test_intake_generic_prompt_skips_model_call(client, calls, prompt):
+    result = await client.intake_strategy(prompt)
+
+    assert calls == []
+    assert result["status"] == "NEEDS_CLARIFICATION"
+    assert result["missing_fields"] == ["entry_logic"]
+    assert result["clarification_questions"] == ["진입 조건을 한 줄로 구체적으로 적어주세요."]
+
+
+@pytest.mark.asyncio
+async def test_intake_generic_prefix_with_conditions_calls_model(client, calls):
+    prompt = "전략 만들어줘: BTCUSDT 5분봉, RSI 30 하향 돌파 시 매수, 70 상향 돌파 시 청산"
+
+    await client.intake_strategy(prompt)
+
+    assert calls == [prompt]
+
+
+@pytest.mark.asyncio
+async def test_llm_connection_check_uses_completion(client, calls):
+    output, error = await client.test_llm("ping")
+
+    assert error is None
+    assert output == '{"verdict": "ok"}'
+    assert calls == ["ping"]
@@ -0,0 +1,47 @@
+"""Unit tests for the REST-polled kline stream's poll scheduling."""
+
+from __future__ import annotations
+
+import pytest
+
+from binance.market_stream import BinanceMarketStream
+
+
+async def _noop(_payload):
+    return None
+
+
+def _stream(poll_sec: float = 10.0) -> BinanceMarketStream:
+    stream = BinanceMarketStream("BTCUSDT", "1m", _noop)
+    stream._poll_interval_sec = poll_sec
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_emit_klines_tracks_in_progress_close_time():
+    stream = _stream()
+    closed = [0, "1", "1", "1", "1", "1", 59_999]
+    in_progress = [60_000, "1", "1", "1", "1", "1", 119_999]
+
+    await stream._emit_klines([closed, in_progress])
+
+    assert stream._in_progress_close_time == 119_999
+
+
+def test_next_poll_delay_wakes_just_after_bar_close():
+    stream = _stream(poll_sec=10.0)
+    stream._in_progress_close_time = 119_999
+
+    # 3초 남은 봉: 고정 10초 대신 마감 직후로 당긴다.
+    assert stream._next_poll_delay(0, now_ms=117_000) == pytest.approx(3.5)
+    # 마감이 폴링 주기보다 멀면 정상 주기 유지.
+    assert stream._next_poll_delay(0, now_ms=60_000) == 10.0
+    # 마감이 지났는데 아직 롤오버 전이면 짧은 간격으로 재확인.
+    assert stream._next_poll_delay(0, now_ms=121_000) == pytest.approx(0.5)
+
+
+def test_next_poll_delay_backs_off_on_errors():
+    stream = _stream(poll_sec=10.0)
+    stream._in_progress_close_time = 119_999
+
+    assert stream._next_poll_delay(2, now_ms=119_000) == 30.0
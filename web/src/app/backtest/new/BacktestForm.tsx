@@ -298,7 +298,7 @@ export function BacktestForm({
   initialMode?: SweepMode;
   initialSweepDimensions?: { path: string; values: (number | string)[] }[];
 }) {
-  const defaults = loadExecutionDefaults();
+  const [defaults] = useState(loadExecutionDefaults);
   const { t } = useI18n();
   const [strategyPath, setStrategyPath] = useState(initialConfig?.strategyPath ?? strategies[0]?.path ?? "");
   const [symbol, setSymbol] = useState(initialConfig?.symbol ?? defaults.symbol);
@@ -83,7 +83,7 @@ export function LiveForm({
   activeCount: number;
   maxSlots: number;
 }) {
-  const defaults = loadExecutionDefaults();
+  const [defaults] = useState(loadExecutionDefaults);
   const { t } = useI18n();
   const [strategyPath, setStrategyPath] = useState(strategies[0]?.path ?? "");
   const [symbol, setSymbol] = useState(defaults.symbol);
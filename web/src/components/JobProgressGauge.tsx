@@ -33,7 +33,10 @@ export function JobProgressGauge({
   const targetRef = useRef(0);
   const rafRef = useRef<number | null>(null);
 
-  const url = useMemo(() => `/api/backend/api/jobs/${jobId}/events/stream?after_event_id=0`, [jobId]);
+  const url = useMemo(
+    () => `/api/backend/api/jobs/${jobId}/events/stream?after_event_id=0&kind=PROGRESS`,
+    [jobId],
+  );
   const finished = FINISHED_STATUSES.has(status);
 
   useEffect(() => {
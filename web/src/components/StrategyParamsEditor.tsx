@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { memo, useEffect, useState } from "react";
 import { extractStrategyParams, getStrategyContent } from "@/lib/api";
 import type { StrategyParamFieldSpec, StrategyParamsExtractResponse } from "@/lib/types";
 
@@ -32,7 +32,7 @@ type Props = {
   disabled?: boolean;
 };
 
-export default function StrategyParamsEditor({
+function StrategyParamsEditor({
   strategyPath,
   code: codeProp,
   values,
@@ -255,3 +255,7 @@ export default function StrategyParamsEditor({
     </div>
   );
 }
+
+// Memoized so parent forms re-rendering on every risk/leverage keystroke skip
+// this subtree; its props (path, values, setState setter) rarely change.
+export default memo(StrategyParamsEditor);